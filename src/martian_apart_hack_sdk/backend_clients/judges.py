@@ -1,47 +1,267 @@
 """Judge API client functions."""
 
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
 import dataclasses
-import json
-from typing import Any, Dict, List, Optional, Union
+import itertools
+import operator
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import httpx
-from openai.types.chat import chat_completion
 
 from martian_apart_hack_sdk import exceptions, judge_specs, utils
 from martian_apart_hack_sdk.models.judge_evaluation import JudgeEvaluation
 from martian_apart_hack_sdk.resources import judge as judge_resource
 
+if TYPE_CHECKING:
+    from openai.types.chat import chat_completion
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_DEFAULT_CONCURRENCY = 16
+# Evaluations run a judge and consume credits, so they are only retried when the request provably
+# did not run: the connection was never established, or the server rejected it up front (429, or
+# 503 with Retry-After). Retries back off exponentially (honoring Retry-After) up to this many attempts.
+_EVALUATION_ATTEMPTS = 5
+_MAX_RETRY_DELAY = 30.0
+_RETRIABLE_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout)
+_JUDGE_FIELDS = operator.itemgetter("name", "version", "description", "createTime")
+
+
+class _JudgesClientBase:
+    """Request and response helpers shared by JudgesClient and AsyncJudgesClient."""
+
+    def __post_init__(self):
+        # The default cache_ttl of 0 gives a disabled cache, so every lookup reaches the API.
+        object.__setattr__(self, "_cache", utils.TTLCache(ttl=self.cache_ttl))
+
+    def _init_judge(self, json_data):
+        name, version, description, create_time = _JUDGE_FIELDS(json_data)
+        return judge_resource.Judge(
+            name=name,
+            version=version,
+            description=description,
+            createTime=create_time,
+            # The API may return `"judgeSpec": null`, not just omit it.
+            judgeSpec=(json_data.get("judgeSpec") or {}).get("judgeSpec"),
+        )
+
+    @staticmethod
+    def _get_judge_spec_payload(judge_spec: Dict[str, Any]) -> Dict[str, Any]:
+        return {"judgeSpec": {"judgeSpec": judge_spec}}
+
+    def _create_judge_payload(
+        self,
+        judge_spec: Union[judge_specs.JudgeSpec, Dict[str, Any]],
+        description: Optional[str],
+    ) -> Dict[str, Any]:
+        if not isinstance(judge_spec, dict):
+            judge_spec = judge_spec.to_dict()
+        payload = self._get_judge_spec_payload(judge_spec)
+        if description is not None:
+            payload["description"] = description
+        return payload
+
+    def _json_request(
+        self, method: str, url: str, payload: Dict[str, Any], **kwargs
+    ) -> httpx.Request:
+        # Serialize the body ourselves so it goes through utils.json_dumps (orjson when available).
+        return self.httpx.build_request(
+            method, url, content=utils.json_dumps(payload), headers=_JSON_HEADERS, **kwargs
+        )
+
+    def _evaluation_request(self, url: str, payload: Dict[str, Any]) -> httpx.Request:
+        # The body is encoded once and the same request resent unchanged on every attempt.
+        return self._json_request(
+            "POST", url, payload, timeout=self.config.evaluation_timeout
+        )
+
+    @staticmethod
+    def _get_judge_params(version: Optional[int]) -> Optional[Dict[str, Any]]:
+        return None if version is None else {"version": version}
+
+    def _created_judge(self, judge_id: str, resp: httpx.Response) -> judge_resource.Judge:
+        if resp.status_code == 409:
+            raise exceptions.ResourceAlreadyExistsError(
+                f"Judge with id {judge_id} already exists"
+            )
+        return self._written_judge(judge_id, resp)
+
+    def _written_judge(self, judge_id: str, resp: httpx.Response) -> judge_resource.Judge:
+        resp.raise_for_status()
+        judge = self._init_judge(json_data=utils.json_loads(resp.content))
+        # Drop stale entries, then remember the judge we just wrote as the latest version.
+        self._cache.clear()
+        self._cache.set(("get", judge_id, None), judge)
+        return judge
+
+    def _fetched_judge(
+        self, judge_id: str, cache_key: tuple, resp: httpx.Response
+    ) -> judge_resource.Judge:
+        if resp.status_code == 404:
+            raise exceptions.ResourceNotFoundError(
+                f"Judge with id {judge_id} does not exist"
+            )
+        resp.raise_for_status()
+        judge = self._init_judge(utils.json_loads(resp.content))
+        self._cache.set(cache_key, judge)
+        return judge
+
+    def _listed_judges(self, resp: httpx.Response) -> Tuple[judge_resource.Judge, ...]:
+        resp.raise_for_status()
+        # map() binds the bound method once instead of looking it up per judge.
+        judges = tuple(map(self._init_judge, utils.json_loads(resp.content)["judges"]))
+        self._cache.set(("list",), judges)
+        return judges
+
+    @staticmethod
+    def _judge_versions(
+        judge_id: str, judges: List[judge_resource.Judge]
+    ) -> List[judge_resource.Judge]:
+        if not judges:
+            raise exceptions.ResourceNotFoundError(
+                f"Judge with id {judge_id} does not exist"
+            )
+        return judges
+
+    @staticmethod
+    def _rendered_prompt(resp: httpx.Response) -> str:
+        resp.raise_for_status()
+        return utils.json_loads(utils.json_loads(resp.content)["prompt"])["rubric_judge"]
+
+    @staticmethod
+    def _judge_evaluation(resp: httpx.Response) -> JudgeEvaluation:
+        resp.raise_for_status()
+        return JudgeEvaluation(**utils.json_loads(resp.content)["judgement"])
+
+    def _prepare_judge_evaluation_payload(
+        self, judge, completion_request, completion_response
+    ):
+        return self._with_judge_version(
+            judge, self._prepare_completion_payload(completion_request, completion_response)
+        )
+
+    def _prepare_completion_payload(self, completion_request, completion_response):
+        # The judge-independent part of an evaluation payload. Serializing the completion is the
+        # expensive part, so it is built once when several judges evaluate the same completion.
+        request_payload = utils.get_evaluation_json_payload(completion_request)
+        completion_payload = utils.get_evaluation_json_payload(
+            # Cost and response fields are required by evaluate judge API
+            self._ensure_cost_response_in_completion(completion_response)
+        )
+        return {
+            "completionCreateParams": request_payload,
+            "chatCompletion": completion_payload,
+        }
+
+    @staticmethod
+    def _with_judge_version(judge, completion_payload):
+        return {"judgeVersion": judge.version, **completion_payload}
+
+    @staticmethod
+    def _retry_delay(attempt: int, resp: Optional[httpx.Response]) -> Optional[float]:
+        # Seconds to wait before retrying the given (1-based) attempt, or None if it must not be retried.
+        # `resp` is None when the attempt failed with one of _RETRIABLE_ERRORS.
+        if attempt >= _EVALUATION_ATTEMPTS:
+            return None
+        retry_after = None if resp is None else resp.headers.get("Retry-After")
+        if resp is not None and not (
+            resp.status_code == 429 or (resp.status_code == 503 and retry_after)
+        ):
+            return None
+        if retry_after is not None and retry_after.isdigit():
+            return min(float(retry_after), _MAX_RETRY_DELAY)
+        return min(2.0 ** (attempt - 1), _MAX_RETRY_DELAY)
+
+    @staticmethod
+    def _ensure_cost_response_in_completion(completion: chat_completion.ChatCompletion):
+        # One JSON round-trip instead of walking the model twice with to_dict().
+        completion_dict = utils.json_loads(completion.to_json(indent=None))
+        completion_dict.setdefault("cost", 0.0)
+        completion_dict.setdefault("response", completion_dict["choices"][0]["message"])
+        return completion_dict
+
+    def _prepare_judge_spec_evaluation_payload(
+        self, judge_spec, completion_request, completion_response
+    ):
+        request_payload = utils.get_evaluation_json_payload(completion_request)
+        completion_payload = utils.get_evaluation_json_payload(
+            self._ensure_cost_response_in_completion(completion_response)
+        )
+        return {
+            "judgeSpec": {"judgeSpec": judge_spec},
+            "completionCreateParams": request_payload,
+            "chatCompletion": completion_payload,
+        }
+
 
 @dataclasses.dataclass(frozen=True)
-class JudgesClient:
+class JudgesClient(_JudgesClientBase):
     """The client for the Martian Judges API. Use the JudgesClient to create, update, and list judges.
 
     Normally, you don't need to create a JudgesClient directly. Instead, use the MartianClient.judges property to access the JudgesClient.
 
+    Results of `get` and `list` can optionally be cached (see `cache_ttl`), so repeated lookups
+    don't refetch the same judges. Caching is off by default, because a cached judge does not
+    reflect changes made by other clients, processes, or the web UI until its entry expires.
+    Creating or updating a judge through this client refreshes the cache with the new version.
+
     Args:
         httpx (httpx.Client): The HTTP client to use for the API.
         config (utils.ClientConfig): The configuration for the API.
+        cache_ttl (float, optional): Number of seconds `get`/`list` results are cached (see utils.TTLCache).
+            Defaults to 0, which disables caching.
     """
 
     httpx: httpx.Client
     config: utils.ClientConfig
+    cache_ttl: float = 0.0
+    _cache: utils.TTLCache = dataclasses.field(init=False, repr=False, compare=False)
 
-    def _init_judge(self, json_data):
-        return judge_resource.Judge(
-            name=json_data["name"],
-            version=json_data["version"],
-            description=json_data["description"],
-            createTime=json_data["createTime"],
-            judgeSpec=json_data.get("judgeSpec", {}).get("judgeSpec"),
-        )
+    def exists(self, judge_id: str) -> bool:
+        """Check whether a judge exists, without building a judge resource.
+
+        Always asks the API, even when lookups are cached, so the answer reflects the current state.
+
+        Args:
+            judge_id (str): The ID of the judge to check.
+
+        Returns:
+            bool: True if the judge exists, False otherwise.
 
-    def _is_judge_exists(self, judge_id: str) -> bool:
+        Raises:
+            httpx.TimeoutException: If the request times out.
+        """
         resp = self.httpx.get(f"/judges/{judge_id}")
         return resp.status_code == 200
 
-    @staticmethod
-    def _get_judge_spec_payload(judge_spec: Dict[str, Any]) -> Dict[str, Any]:
-        return {"judgeSpec": {"judgeSpec": judge_spec}}
+    def _post_evaluation(self, url: str, payload: Dict[str, Any]) -> httpx.Response:
+        request = self._evaluation_request(url, payload)
+        for attempt in itertools.count(1):
+            try:
+                resp = self.httpx.send(request)
+            except _RETRIABLE_ERRORS:
+                delay = self._retry_delay(attempt, None)
+                if delay is None:
+                    raise
+            else:
+                delay = self._retry_delay(attempt, resp)
+                if delay is None:
+                    return resp
+            time.sleep(delay)
 
     def create_judge(
         self,
@@ -64,20 +284,11 @@ class JudgesClient:
             httpx.HTTPError: If the request fails.
             httpx.TimeoutException: If the request times out.
         """
-
-        if self._is_judge_exists(judge_id):
-            raise exceptions.ResourceAlreadyExistsError(
-                f"Judge with id {judge_id} already exists"
-            )
-        if not isinstance(judge_spec, dict):
-            judge_spec = judge_spec.to_dict()
-        payload = self._get_judge_spec_payload(judge_spec)
-        if description is not None:
-            payload["description"] = description
+        payload = self._create_judge_payload(judge_spec, description)
         params = {"judgeId": judge_id}
-        resp = self.httpx.post("/judges", params=params, json=payload)
-        resp.raise_for_status()
-        return self._init_judge(json_data=resp.json())
+        # Create optimistically and let the API report duplicates, instead of a separate existence check.
+        resp = self.httpx.send(self._json_request("POST", "/judges", payload, params=params))
+        return self._created_judge(judge_id, resp)
 
     def update_judge(
         self, judge_id: str, judge_spec: judge_specs.JudgeSpec
@@ -102,9 +313,8 @@ class JudgesClient:
         """
         payload = self._get_judge_spec_payload(judge_spec.to_dict())
         # can't update labels/description in API
-        resp = self.httpx.patch(f"/judges/{judge_id}", json=payload)
-        resp.raise_for_status()
-        return self._init_judge(json_data=resp.json())
+        resp = self.httpx.send(self._json_request("PATCH", f"/judges/{judge_id}", payload))
+        return self._written_judge(judge_id, resp)
 
     def list(self) -> list[judge_resource.Judge]:
         """List all judges in your organization.
@@ -116,9 +326,31 @@ class JudgesClient:
             httpx.HTTPError: If the request fails.
             httpx.TimeoutException: If the request times out.
         """
-        resp = self.httpx.get("/judges")
-        resp.raise_for_status()
-        return [self._init_judge(j) for j in resp.json()["judges"]]
+        judges = self._cache.get(("list",))
+        if judges is None:
+            judges = self._listed_judges(self.httpx.get("/judges"))
+        return list(judges)
+
+    def iter_judges(self) -> Iterator[judge_resource.Judge]:
+        """Iterate over all judges in your organization as the response arrives.
+
+        Unlike `list`, this streams the response body and, when `ijson` is installed, parses it
+        incrementally, so memory stays flat however many judges the organization has.
+        Without `ijson`, the body is parsed in one go once it has been received.
+        Results are never served from or stored in the `get`/`list` cache.
+
+        Yields:
+            judge_resource.Judge: Each judge, in the order returned by the API.
+
+        Raises:
+            httpx.HTTPError: If the request fails.
+            httpx.TimeoutException: If the request times out.
+        """
+        with self.httpx.stream("GET", "/judges") as resp:
+            resp.raise_for_status()
+            yield from map(
+                self._init_judge, utils.iter_json_array(resp.iter_bytes(), "judges")
+            )
 
     def get(self, judge_id: str, version=None) -> judge_resource.Judge:
         """Get a specific judge by ID and optionally version.
@@ -135,16 +367,54 @@ class JudgesClient:
             httpx.HTTPError: If the request fails for reasons other than a missing judge.
             httpx.TimeoutException: If the request times out.
         """
-        params = dict(version=version) if version else None
-        resp = self.httpx.get(f"/judges/{judge_id}", params=params)
+        cache_key = ("get", judge_id, version)
+        judge = self._cache.get(cache_key)
+        if judge is not None:
+            return judge
 
-        if resp.status_code == 404:
-            raise exceptions.ResourceNotFoundError(
-                f"Judge with id {judge_id} does not exist"
-            )
+        resp = self.httpx.get(f"/judges/{judge_id}", params=self._get_judge_params(version))
+        return self._fetched_judge(judge_id, cache_key, resp)
 
-        resp.raise_for_status()
-        return self._init_judge(resp.json())
+    def get_many(
+        self,
+        judge_ids: Iterable[str],
+        concurrency: int = _DEFAULT_CONCURRENCY,
+        return_exceptions: bool = False,
+    ) -> List[Union[judge_resource.Judge, Exception]]:
+        """Get the latest version of several judges, running the requests concurrently.
+
+        The requests are sent from a pool of worker threads sharing this client's connection pool.
+        Each distinct ID is fetched once, even when it is repeated and caching is disabled; when
+        caching is enabled (see `cache_ttl`), cached judges are reused as with `get`.
+
+        Args:
+            judge_ids (Iterable[str]): The IDs of the judges to get.
+            concurrency (int, optional): Maximum number of requests in flight at once. Defaults to 16.
+            return_exceptions (bool, optional): If True, a failed lookup's exception is returned in its
+                place instead of being raised. Defaults to False.
+
+        Returns:
+            List[Union[judge_resource.Judge, Exception]]: The judges, in the same order as the IDs.
+
+        Raises:
+            ResourceNotFoundError: If a judge does not exist and return_exceptions is False.
+            httpx.HTTPError: If a request fails and return_exceptions is False.
+            httpx.TimeoutException: If a request times out and return_exceptions is False.
+        """
+
+        def get_judge(judge_id):
+            try:
+                return self.get(judge_id)
+            except Exception as e:
+                if return_exceptions:
+                    return e
+                raise
+
+        judge_ids = list(judge_ids)
+        unique_ids = list(dict.fromkeys(judge_ids))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+            judges = dict(zip(unique_ids, executor.map(get_judge, unique_ids)))
+        return [judges[judge_id] for judge_id in judge_ids]
 
     def get_versions(self, judge_id: str) -> List[judge_resource.Judge]:
         """Get all versions of a specific judge.
@@ -163,13 +433,29 @@ class JudgesClient:
             httpx.HTTPError: If the request fails.
             httpx.TimeoutException: If the request times out.
         """
-        resp = self.httpx.get(f"/judges/{judge_id}/versions")
-        resp.raise_for_status()
-        if not resp.json()["judges"]:
-            raise exceptions.ResourceNotFoundError(
-                f"Judge with id {judge_id} does not exist"
+        return self._judge_versions(judge_id, list(self.iter_versions(judge_id)))
+
+    def iter_versions(self, judge_id: str) -> Iterator[judge_resource.Judge]:
+        """Iterate over all versions of a specific judge as the response arrives.
+
+        Streams the response like `iter_judges`. Unlike `get_versions`, an unknown judge
+        simply yields nothing.
+
+        Args:
+            judge_id (str): The ID of the judge to get versions for.
+
+        Yields:
+            judge_resource.Judge: Each version of the judge, ordered from newest to oldest.
+
+        Raises:
+            httpx.HTTPError: If the request fails.
+            httpx.TimeoutException: If the request times out.
+        """
+        with self.httpx.stream("GET", f"/judges/{judge_id}/versions") as resp:
+            resp.raise_for_status()
+            yield from map(
+                self._init_judge, utils.iter_json_array(resp.iter_bytes(), "judges")
             )
-        return [self._init_judge(j) for j in resp.json()["judges"]]
 
     def render_prompt(
         self,
@@ -202,39 +488,13 @@ class JudgesClient:
         payload = self._prepare_judge_evaluation_payload(
             judge, completion_request, completion_response
         )
-        resp = self.httpx.post(
+        request = self._json_request(
+            "POST",
             f"/judges/{judge.id}:render",
-            json=payload,
+            payload,
             timeout=self.config.evaluation_timeout,
         )
-        resp.raise_for_status()
-        return json.loads(resp.json()["prompt"])["rubric_judge"]
-
-    def _prepare_judge_evaluation_payload(
-        self, judge, completion_request, completion_response
-    ):
-        request_payload = utils.get_evaluation_json_payload(completion_request)
-        completion_payload = utils.get_evaluation_json_payload(
-            # Cost and response fields are required by evaluate judge API
-            self._ensure_cost_response_in_completion(completion_response)
-        )
-        payload = {
-            "judgeVersion": judge.version,
-            "completionCreateParams": request_payload,
-            "chatCompletion": completion_payload,
-        }
-        return payload
-
-    @staticmethod
-    def _get_evaluation_json_payload(data: Dict[str, Any]):
-        return {"jsonPayload": json.dumps(data)}
-
-    @staticmethod
-    def _ensure_cost_response_in_completion(completion: chat_completion.ChatCompletion):
-        return {
-            "cost": 0.0,
-            "response": completion.choices[0].message.to_dict(),
-        } | completion.to_dict()
+        return self._rendered_prompt(self.httpx.send(request))
 
     def evaluate(
         self,
@@ -246,6 +506,10 @@ class JudgesClient:
 
         This method sends the completion request and response to the judge for evaluation.
         The judge will assess the response based on its rubric and return a structured evaluation.
+        Requests that provably did not run (rate limited with 429, 503 with a Retry-After header,
+        or a connection that could not be established) are retried up to 5 times with exponential
+        backoff, honoring the server's Retry-After header. Other failures are not retried, since the
+        judge may already have run and been billed.
 
         Args:
             judge (judge_resource.Judge): The judge to use for evaluation.
@@ -266,13 +530,102 @@ class JudgesClient:
         payload = self._prepare_judge_evaluation_payload(
             judge, completion_request, completion_response
         )
-        resp = self.httpx.post(
-            f"/judges/{judge.id}:evaluate",
-            json=payload,
-            timeout=self.config.evaluation_timeout,
+        return self._evaluate_payload(judge, payload)
+
+    def _evaluate_payload(
+        self, judge: judge_resource.Judge, payload: Dict[str, Any]
+    ) -> JudgeEvaluation:
+        return self._judge_evaluation(
+            self._post_evaluation(f"/judges/{judge.id}:evaluate", payload)
         )
-        resp.raise_for_status()
-        return JudgeEvaluation(**resp.json()["judgement"])
+
+    def evaluate_many(
+        self,
+        judge: judge_resource.Judge,
+        request_response_pairs: Iterable[
+            Tuple[Dict[str, Any], chat_completion.ChatCompletion]
+        ],
+        concurrency: int = _DEFAULT_CONCURRENCY,
+        return_exceptions: bool = False,
+    ) -> List[Union[JudgeEvaluation, Exception]]:
+        """Evaluate many LLM responses with one judge, running the requests concurrently.
+
+        The evaluations are sent from a pool of worker threads sharing this client's connection pool,
+        so N evaluations take roughly N / concurrency round trips instead of N.
+
+        Args:
+            judge (judge_resource.Judge): The judge to use for evaluation.
+            request_response_pairs (Iterable[Tuple[Dict[str, Any], chat_completion.ChatCompletion]]):
+                (completion_request, completion_response) pairs to evaluate.
+            concurrency (int, optional): Maximum number of evaluations in flight at once. Defaults to 16.
+            return_exceptions (bool, optional): If True, a failed evaluation's exception is returned in its
+                place instead of being raised. Defaults to False.
+
+        Returns:
+            List[Union[JudgeEvaluation, Exception]]: The evaluation results, in the same order as the pairs.
+
+        Raises:
+            ResourceNotFoundError: If the judge with the given ID does not exist.
+            httpx.HTTPError: If a request fails and return_exceptions is False.
+            httpx.TimeoutException: If a request times out and return_exceptions is False.
+        """
+
+        def evaluate_pair(pair):
+            completion_request, completion_response = pair
+            try:
+                return self.evaluate(judge, completion_request, completion_response)
+            except Exception as e:
+                if return_exceptions:
+                    return e
+                raise
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return list(executor.map(evaluate_pair, request_response_pairs))
+
+    def evaluate_with_judges(
+        self,
+        judges: Iterable[judge_resource.Judge],
+        completion_request: Dict[str, Any],
+        completion_response: chat_completion.ChatCompletion,
+        concurrency: int = _DEFAULT_CONCURRENCY,
+        return_exceptions: bool = False,
+    ) -> List[Union[JudgeEvaluation, Exception]]:
+        """Evaluate one LLM response with several judges, running the requests concurrently.
+
+        The completion is serialized once and the result reused for every judge, instead of once
+        per `evaluate` call. Useful for composite scores built from several judges.
+
+        Args:
+            judges (Iterable[judge_resource.Judge]): The judges to use for evaluation.
+            completion_request (Dict[str, Any]): The original completion request parameters that were sent to the LLM.
+            completion_response (chat_completion.ChatCompletion): The completion response from the LLM to evaluate.
+            concurrency (int, optional): Maximum number of evaluations in flight at once. Defaults to 16.
+            return_exceptions (bool, optional): If True, a failed evaluation's exception is returned in its
+                place instead of being raised. Defaults to False.
+
+        Returns:
+            List[Union[JudgeEvaluation, Exception]]: The evaluation results, in the same order as the judges.
+
+        Raises:
+            httpx.HTTPError: If a request fails and return_exceptions is False.
+            httpx.TimeoutException: If a request times out and return_exceptions is False.
+        """
+        completion_payload = self._prepare_completion_payload(
+            completion_request, completion_response
+        )
+
+        def evaluate_judge(judge):
+            try:
+                return self._evaluate_payload(
+                    judge, self._with_judge_version(judge, completion_payload)
+                )
+            except Exception as e:
+                if return_exceptions:
+                    return e
+                raise
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return list(executor.map(evaluate_judge, judges))
 
     def evaluate_using_judge_spec(
         self,
@@ -301,16 +654,242 @@ class JudgesClient:
             httpx.HTTPError: If the request fails.
             httpx.TimeoutException: If the request times out based on evaluation_timeout config.
         """
-        request_payload = utils.get_evaluation_json_payload(completion_request)
-        completion_payload = utils.get_evaluation_json_payload(
-            self._ensure_cost_response_in_completion(completion_response)
+        payload = self._prepare_judge_spec_evaluation_payload(
+            judge_spec, completion_request, completion_response
         )
-        payload = self._get_judge_spec_payload(judge_spec) | {
-            "completionCreateParams": request_payload,
-            "chatCompletion": completion_payload,
-        }
-        resp = self.httpx.post(
-            "/judges:evaluate", json=payload, timeout=self.config.evaluation_timeout
+        return self._judge_evaluation(self._post_evaluation("/judges:evaluate", payload))
+
+
+@dataclasses.dataclass(frozen=True)
+class AsyncJudgesClient(_JudgesClientBase):
+    """The asyncio counterpart of JudgesClient.
+
+    Every method is a coroutine with the same arguments, return values, and errors as its
+    JudgesClient counterpart, so many evaluations can run concurrently, e.g. with `asyncio.gather`.
+
+    Normally, you don't need to create an AsyncJudgesClient directly. Instead, use the AsyncMartianClient.judges property.
+
+    Args:
+        httpx (httpx.AsyncClient): The async HTTP client to use for the API.
+        config (utils.ClientConfig): The configuration for the API.
+        cache_ttl (float, optional): Number of seconds `get`/`list` results are cached. Defaults to 0,
+            which disables caching.
+    """
+
+    httpx: httpx.AsyncClient
+    config: utils.ClientConfig
+    cache_ttl: float = 0.0
+    _cache: utils.TTLCache = dataclasses.field(init=False, repr=False, compare=False)
+
+    async def _post_evaluation(
+        self, url: str, payload: Dict[str, Any]
+    ) -> httpx.Response:
+        request = self._evaluation_request(url, payload)
+        for attempt in itertools.count(1):
+            try:
+                resp = await self.httpx.send(request)
+            except _RETRIABLE_ERRORS:
+                delay = self._retry_delay(attempt, None)
+                if delay is None:
+                    raise
+            else:
+                delay = self._retry_delay(attempt, resp)
+                if delay is None:
+                    return resp
+            await asyncio.sleep(delay)
+
+    async def exists(self, judge_id: str) -> bool:
+        """Check whether a judge exists. See JudgesClient.exists."""
+        resp = await self.httpx.get(f"/judges/{judge_id}")
+        return resp.status_code == 200
+
+    async def create_judge(
+        self,
+        judge_id: str,
+        judge_spec: Union[judge_specs.JudgeSpec, Dict[str, Any]],
+        description: Optional[str] = None,
+    ) -> judge_resource.Judge:
+        """Create a judge. See JudgesClient.create_judge."""
+        payload = self._create_judge_payload(judge_spec, description)
+        params = {"judgeId": judge_id}
+        resp = await self.httpx.send(
+            self._json_request("POST", "/judges", payload, params=params)
+        )
+        return self._created_judge(judge_id, resp)
+
+    async def update_judge(
+        self, judge_id: str, judge_spec: judge_specs.JudgeSpec
+    ) -> judge_resource.Judge:
+        """Update a judge, creating a new version. See JudgesClient.update_judge."""
+        payload = self._get_judge_spec_payload(judge_spec.to_dict())
+        resp = await self.httpx.send(
+            self._json_request("PATCH", f"/judges/{judge_id}", payload)
+        )
+        return self._written_judge(judge_id, resp)
+
+    async def list(self) -> list[judge_resource.Judge]:
+        """List all judges in your organization. See JudgesClient.list."""
+        judges = self._cache.get(("list",))
+        if judges is None:
+            judges = self._listed_judges(await self.httpx.get("/judges"))
+        return list(judges)
+
+    async def iter_judges(self) -> AsyncIterator[judge_resource.Judge]:
+        """Iterate over all judges in your organization as the response arrives. See JudgesClient.iter_judges."""
+        async with self.httpx.stream("GET", "/judges") as resp:
+            resp.raise_for_status()
+            async for json_data in utils.aiter_json_array(resp.aiter_bytes(), "judges"):
+                yield self._init_judge(json_data)
+
+    async def get(self, judge_id: str, version=None) -> judge_resource.Judge:
+        """Get a specific judge by ID and optionally version. See JudgesClient.get."""
+        cache_key = ("get", judge_id, version)
+        judge = self._cache.get(cache_key)
+        if judge is not None:
+            return judge
+
+        resp = await self.httpx.get(
+            f"/judges/{judge_id}", params=self._get_judge_params(version)
+        )
+        return self._fetched_judge(judge_id, cache_key, resp)
+
+    async def get_many(
+        self,
+        judge_ids: Iterable[str],
+        concurrency: int = _DEFAULT_CONCURRENCY,
+        return_exceptions: bool = False,
+    ) -> List[Union[judge_resource.Judge, Exception]]:
+        """Get the latest version of several judges concurrently. See JudgesClient.get_many.
+
+        At most `concurrency` requests are in flight at once, each distinct ID is fetched once,
+        and results keep the order of the IDs.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def get_judge(judge_id):
+            async with semaphore:
+                return await self.get(judge_id)
+
+        judge_ids = list(judge_ids)
+        unique_ids = list(dict.fromkeys(judge_ids))
+        results = await asyncio.gather(
+            *(get_judge(judge_id) for judge_id in unique_ids),
+            return_exceptions=return_exceptions,
+        )
+        judges = dict(zip(unique_ids, results))
+        return [judges[judge_id] for judge_id in judge_ids]
+
+    async def get_versions(self, judge_id: str) -> List[judge_resource.Judge]:
+        """Get all versions of a specific judge, newest first. See JudgesClient.get_versions."""
+        judges = [judge async for judge in self.iter_versions(judge_id)]
+        return self._judge_versions(judge_id, judges)
+
+    async def iter_versions(self, judge_id: str) -> AsyncIterator[judge_resource.Judge]:
+        """Iterate over all versions of a specific judge as the response arrives. See JudgesClient.iter_versions."""
+        async with self.httpx.stream("GET", f"/judges/{judge_id}/versions") as resp:
+            resp.raise_for_status()
+            async for json_data in utils.aiter_json_array(resp.aiter_bytes(), "judges"):
+                yield self._init_judge(json_data)
+
+    async def render_prompt(
+        self,
+        judge: judge_resource.Judge,
+        completion_request: Dict[str, Any],
+        completion_response: chat_completion.ChatCompletion,
+    ) -> str:
+        """Render the judging prompt for a judge. See JudgesClient.render_prompt."""
+        payload = self._prepare_judge_evaluation_payload(
+            judge, completion_request, completion_response
+        )
+        request = self._json_request(
+            "POST",
+            f"/judges/{judge.id}:render",
+            payload,
+            timeout=self.config.evaluation_timeout,
+        )
+        return self._rendered_prompt(await self.httpx.send(request))
+
+    async def evaluate(
+        self,
+        judge: judge_resource.Judge,
+        completion_request: Dict[str, Any],
+        completion_response: chat_completion.ChatCompletion,
+    ) -> JudgeEvaluation:
+        """Evaluate an LLM response using a specific judge. See JudgesClient.evaluate."""
+        payload = self._prepare_judge_evaluation_payload(
+            judge, completion_request, completion_response
+        )
+        return await self._evaluate_payload(judge, payload)
+
+    async def _evaluate_payload(
+        self, judge: judge_resource.Judge, payload: Dict[str, Any]
+    ) -> JudgeEvaluation:
+        return self._judge_evaluation(
+            await self._post_evaluation(f"/judges/{judge.id}:evaluate", payload)
+        )
+
+    async def evaluate_many(
+        self,
+        judge: judge_resource.Judge,
+        request_response_pairs: Iterable[
+            Tuple[Dict[str, Any], chat_completion.ChatCompletion]
+        ],
+        concurrency: int = _DEFAULT_CONCURRENCY,
+        return_exceptions: bool = False,
+    ) -> List[Union[JudgeEvaluation, Exception]]:
+        """Evaluate many LLM responses with one judge concurrently. See JudgesClient.evaluate_many.
+
+        At most `concurrency` evaluations are in flight at once; results keep the order of the pairs.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def evaluate_pair(completion_request, completion_response):
+            async with semaphore:
+                return await self.evaluate(judge, completion_request, completion_response)
+
+        return await asyncio.gather(
+            *(
+                evaluate_pair(completion_request, completion_response)
+                for completion_request, completion_response in request_response_pairs
+            ),
+            return_exceptions=return_exceptions,
+        )
+
+    async def evaluate_with_judges(
+        self,
+        judges: Iterable[judge_resource.Judge],
+        completion_request: Dict[str, Any],
+        completion_response: chat_completion.ChatCompletion,
+        concurrency: int = _DEFAULT_CONCURRENCY,
+        return_exceptions: bool = False,
+    ) -> List[Union[JudgeEvaluation, Exception]]:
+        """Evaluate one LLM response with several judges concurrently. See JudgesClient.evaluate_with_judges."""
+        completion_payload = self._prepare_completion_payload(
+            completion_request, completion_response
+        )
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def evaluate_judge(judge):
+            async with semaphore:
+                return await self._evaluate_payload(
+                    judge, self._with_judge_version(judge, completion_payload)
+                )
+
+        return await asyncio.gather(
+            *(evaluate_judge(judge) for judge in judges),
+            return_exceptions=return_exceptions,
+        )
+
+    async def evaluate_using_judge_spec(
+        self,
+        judge_spec: Dict[str, Any],
+        completion_request: Dict[str, Any],
+        completion_response: chat_completion.ChatCompletion,
+    ) -> JudgeEvaluation:
+        """Evaluate an LLM response using a judge specification directly. See JudgesClient.evaluate_using_judge_spec."""
+        payload = self._prepare_judge_spec_evaluation_payload(
+            judge_spec, completion_request, completion_response
+        )
+        return self._judge_evaluation(
+            await self._post_evaluation("/judges:evaluate", payload)
         )
-        resp.raise_for_status()
-        return JudgeEvaluation(**resp.json()["judgement"])
@@ -34,4 +34,33 @@ class OrganizationClient:
         """
         resp = self.httpx.get("/credits")
         resp.raise_for_status()
-        return organization_balance.OrganizationBalance(**resp.json())
+        return organization_balance.OrganizationBalance(**utils.json_loads(resp.content))
+
+
+@dataclasses.dataclass(frozen=True)
+class AsyncOrganizationClient:
+    """The asyncio counterpart of OrganizationClient.
+
+    Normally, you don't need to create an AsyncOrganizationClient directly. Instead, use the AsyncMartianClient.organization property.
+
+    Args:
+        httpx (httpx.AsyncClient): The async HTTP client to use for the API.
+        config (utils.ClientConfig): The configuration for the API.
+    """
+
+    httpx: httpx.AsyncClient
+    config: utils.ClientConfig
+
+    async def get_credit_balance(self) -> organization_balance.OrganizationBalance:
+        """Get the current credit balance for the organization.
+
+        Returns:
+            OrganizationBalance: The organization's current credit balance in USD.
+
+        Raises:
+            httpx.HTTPError: If the request fails.
+            httpx.TimeoutException: If the request times out.
+        """
+        resp = await self.httpx.get("/credits")
+        resp.raise_for_status()
+        return organization_balance.OrganizationBalance(**utils.json_loads(resp.content))
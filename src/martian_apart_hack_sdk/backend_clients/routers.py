@@ -1,53 +1,314 @@
 """Router API client functions."""
 
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
 import dataclasses
-import datetime as dt
+import functools
 import logging
+import operator
+import random
 import time
-from typing import Any, Dict, List, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Union,
+)
 
 import httpx
-import openai
-from openai.types.chat import chat_completion
 
 from martian_apart_hack_sdk import exceptions, utils
 from martian_apart_hack_sdk.models import router_constraints, router_training_job
 from martian_apart_hack_sdk.resources import judge as judge_resource
 from martian_apart_hack_sdk.resources import router as router_resource
 
+if TYPE_CHECKING:
+    import openai
+    from openai.types.chat import chat_completion
+
 _LOGGER = logging.getLogger(__name__)
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_ROUTER_FIELDS = operator.itemgetter("name", "version", "description", "createTime")
+_TERMINAL_TRAINING_JOB_STATUSES = ("SUCCESS", "FAILURE_WITHOUT_RETRY", "FAILURE")
+# Training jobs are polled quickly at first, then with a delay growing by this factor up to poll_interval.
+# Each wait is shifted by up to _POLL_JITTER of itself (never past poll_interval), so jobs started
+# together don't poll in lockstep.
+_INITIAL_POLL_DELAY = 1.0
+_POLL_BACKOFF_FACTOR = 1.5
+_POLL_JITTER = 0.1
+_DEFAULT_RUN_CONCURRENCY = 16
+
+
+def _get_model_executor(base_model: str, x: float, y: float) -> Dict[str, Any]:
+    return {
+        "point": {"x": x, "y": y},
+        "executor": {
+            "spec": {"executor_type": "ModelExecutor", "model_name": base_model}
+        },
+    }
+
+
+def _default_router_points(base_model: str) -> List[Dict[str, Any]]:
+    return [
+        _get_model_executor(base_model, x=0.0, y=0.0),
+        _get_model_executor(base_model, x=1.0, y=1.0),
+    ]
+
+
+class _RoutersClientBase:
+    """Request and response helpers shared by RoutersClient and AsyncRoutersClient."""
+
+    def __post_init__(self):
+        # The default cache_ttl of 0 gives a disabled cache, so every lookup reaches the API.
+        object.__setattr__(self, "_cache", utils.TTLCache(ttl=self.cache_ttl))
+
+    def _init_router(self, json_data):
+        name, version, description, create_time = _ROUTER_FIELDS(json_data)
+        return router_resource.Router(
+            name=name,
+            version=version,
+            description=description,
+            createTime=create_time,
+            routerSpec=json_data.get("routerSpec"),
+        )
+
+    def _json_request(
+        self, method: str, url: str, payload: Dict[str, Any], **kwargs
+    ) -> httpx.Request:
+        # Serialize the body ourselves so it goes through utils.json_dumps (orjson when available).
+        return self.httpx.build_request(
+            method, url, content=utils.json_dumps(payload), headers=_JSON_HEADERS, **kwargs
+        )
+
+    @staticmethod
+    def _get_router_params(version: Optional[int]) -> Optional[Dict[str, Any]]:
+        return None if version is None else {"version": version}
+
+    def _created_router(self, router_id: str, resp: httpx.Response) -> router_resource.Router:
+        if resp.status_code == 409:
+            raise exceptions.ResourceAlreadyExistsError(
+                f"Router with id {router_id} already exists"
+            )
+        return self._written_router(router_id, resp)
+
+    def _updated_router(self, router_id: str, resp: httpx.Response) -> router_resource.Router:
+        if resp.status_code == 404:
+            raise exceptions.ResourceNotFoundError(
+                f"Router with id {router_id} not found"
+            )
+        return self._written_router(router_id, resp)
+
+    def _written_router(self, router_id: str, resp: httpx.Response) -> router_resource.Router:
+        resp.raise_for_status()
+        router = self._init_router(utils.json_loads(resp.content))
+        # Drop stale versions, then remember the router we just wrote as the latest version.
+        self._cache.clear()
+        self._cache.set(("get", router_id, None), router)
+        return router
+
+    def _fetched_router(
+        self, router_id: str, cache_key: tuple, resp: httpx.Response
+    ) -> router_resource.Router:
+        if resp.status_code == 404:
+            raise exceptions.ResourceNotFoundError(
+                f"Router with id {router_id} not found"
+            )
+        resp.raise_for_status()
+        router = self._init_router(utils.json_loads(resp.content))
+        self._cache.set(cache_key, router)
+        return router
+
+    @staticmethod
+    def _router_not_found(router: router_resource.Router) -> exceptions.ResourceNotFoundError:
+        # No existence preflight: an unknown router is reported by the run itself.
+        return exceptions.ResourceNotFoundError(f"Router with id {router.id} not found")
+
+    def _create_router_payload(
+        self, base_model: str, description: Optional[str]
+    ) -> Dict[str, Any]:
+        router_spec = {"points": _default_router_points(base_model)}
+        return self._update_router_payload(router_spec, description)
+
+    def _update_router_payload(
+        self, router_spec: Dict[str, Any], description: Optional[str]
+    ) -> Dict[str, Any]:
+        payload = {"routerSpec": router_spec}
+        if description is not None:
+            payload["description"] = description
+        return payload
+
+    def _completion_create_kwargs(
+        self,
+        router: router_resource.Router,
+        routing_constraint: router_constraints.RoutingConstraint,
+        completion_request: Dict[str, Any],
+        version: Optional[int],
+    ) -> Dict[str, Any]:
+        if version is not None:
+            version_to_use = version
+        elif router.version is not None:
+            version_to_use = router.version
+        else:
+            version_to_use = "latest"
+
+        return {
+            **completion_request,
+            "model": f"{router.name}/versions/{version_to_use}",
+            "extra_body": router_constraints.render_extra_body_router_constraint(
+                routing_constraint
+            ),
+            "timeout": self.config.evaluation_timeout,
+        }
+
+    @staticmethod
+    def _training_job_payload(
+        router: router_resource.Router,
+        judge: judge_resource.Judge,
+        llms: List[str],
+        requests: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        if llms is None or not llms:
+            raise exceptions.InvalidParameterError(
+                "At least one LLM model name must be provided"
+            )
+        if not isinstance(llms, list):
+            raise exceptions.InvalidParameterError(
+                "llms param must be a list of strings"
+            )
+        return {
+            "routerName": router.name,
+            "judgeName": judge.name,
+            "llms": list(dict.fromkeys(llms)),  # Dedupe, keeping the caller's order.
+            "requests": requests,
+        }
+
+    @staticmethod
+    def _training_job(resp: httpx.Response) -> router_training_job.RouterTrainingJob:
+        resp.raise_for_status()
+        return router_training_job.RouterTrainingJob.from_dict(utils.json_loads(resp.content))
+
+    def _started_training_job(
+        self, resp: httpx.Response, payload: Dict[str, Any]
+    ) -> router_training_job.RouterTrainingJob:
+        job = self._training_job(resp)
+        _LOGGER.info(
+            "Started training job %s for router %s with judge %s and LLMs: %s",
+            job.name,
+            payload["routerName"],
+            payload["judgeName"],
+            payload["llms"],
+        )
+        return job
+
+    @staticmethod
+    def _with_jitter(delay: float, poll_interval: float) -> float:
+        return min(delay * random.uniform(1.0 - _POLL_JITTER, 1.0 + _POLL_JITTER), poll_interval)
+
+    @classmethod
+    def _training_job_poll_delays(
+        cls, job_id: str, poll_interval: float, poll_timeout: float
+    ) -> Iterator[float]:
+        # Seconds to wait before each poll of a training job: none before the first, then a jittered
+        # backoff up to poll_interval. Raises TimeoutError rather than wait past poll_timeout.
+        deadline = time.monotonic() + poll_timeout
+        delay = min(_INITIAL_POLL_DELAY, poll_interval)
+        yield 0.0
+        while True:
+            wait = cls._with_jitter(delay, poll_interval)
+            if time.monotonic() + wait > deadline:
+                raise TimeoutError(
+                    f"Training job {job_id} did not complete within {poll_timeout} seconds"
+                )
+            yield wait
+            delay = min(delay * _POLL_BACKOFF_FACTOR, poll_interval)
+
+    @staticmethod
+    def _is_training_job_finished(
+        job_id: str,
+        job: router_training_job.RouterTrainingJob,
+    ) -> bool:
+        _LOGGER.info("Training job %s status: %s", job_id, job.status)
+
+        if job.status == "FAILURE_WITHOUT_RETRY":
+            _LOGGER.info("Job failed. All attempts have been exhausted.")
+            if job.error_message:
+                _LOGGER.error("Error message: %s", job.error_message)
+            _LOGGER.info("Retry count: %d", job.retry_count)
+
+        if job.status == "FAILURE":
+            _LOGGER.info("Job failed.")
+            if job.error_message:
+                _LOGGER.error("Error message: %s", job.error_message)
+            _LOGGER.info("Retry count: %d", job.retry_count)
+
+        if job.status in _TERMINAL_TRAINING_JOB_STATUSES:
+            _LOGGER.info(
+                "Training job %s completed with status: %s", job_id, job.status
+            )
+            return True
+        return False
+
 
 @dataclasses.dataclass(frozen=True)
-class RoutersClient:
+class RoutersClient(_RoutersClientBase):
     """The client for the Martian Routers API. Use the RoutersClient to create, update, and list routers.
 
     Normally, you don't need to create a RoutersClient directly. Instead, use the MartianClient.routers property to access the RoutersClient.
 
+    Results of `get` can optionally be cached (see `cache_ttl`), so repeated lookups don't refetch
+    the same router. Caching is off by default, because a cached router does not reflect changes made
+    by other clients, processes, or the web UI until its entry expires. Creating or updating a router
+    through this client refreshes the cache with the new version.
+
     Args:
         httpx (httpx.Client): The HTTP client to use for the API.
         config (utils.ClientConfig): The configuration for the API.
+        cache_ttl (float, optional): Number of seconds `get` results are cached (see utils.TTLCache).
+            Defaults to 0, which disables caching.
     """
 
     httpx: httpx.Client
     config: utils.ClientConfig
+    cache_ttl: float = 0.0
+    _cache: utils.TTLCache = dataclasses.field(init=False, repr=False, compare=False)
 
-    def _init_router(self, json_data):
-        return router_resource.Router(
-            name=json_data["name"],
-            version=json_data["version"],
-            description=json_data["description"],
-            createTime=json_data["createTime"],
-            routerSpec=json_data.get("routerSpec"),
-        )
+    def exists(self, router_id: str) -> bool:
+        """Check whether a router exists, without building a router resource.
 
-    def _is_router_exists(self, router_id: str) -> bool:
+        Always asks the API, even when lookups are cached, so the answer reflects the current state.
+
+        Args:
+            router_id (str): The ID of the router to check.
+
+        Returns:
+            bool: True if the router exists, False otherwise.
+
+        Raises:
+            httpx.TimeoutException: If the request times out.
+        """
         resp = self.httpx.get(f"/routers/{router_id}")
         return resp.status_code == 200
 
-    @staticmethod
-    def _get_router_spec_payload(router_spec: Dict[str, Any]) -> Dict[str, Any]:
-        return {"routerSpec": router_spec}
+    @functools.cached_property
+    def _openai_client(self) -> openai.OpenAI:
+        # Imported lazily: only running a router needs the full OpenAI client.
+        import openai
+
+        # Built once per client, on top of the SDK's HTTP client, so router runs share its
+        # connection pool; closing the MartianClient closes it too.
+        return openai.OpenAI(
+            api_key=self.config.api_key,
+            base_url=self.config.openai_api_url,
+            http_client=self.httpx,
+        )
 
     def create_router(
         self,
@@ -70,32 +331,11 @@ class RoutersClient:
             httpx.HTTPError: If the request fails.
             httpx.TimeoutException: If the request times out.
         """
-        if self._is_router_exists(router_id):
-            raise exceptions.ResourceAlreadyExistsError(
-                f"Router with id {router_id} already exists"
-            )
-        router_spec = {
-            "points": [
-                self._get_model_executor(base_model, x=0.0, y=0.0),
-                self._get_model_executor(base_model, x=1.0, y=1.0),
-            ]
-        }
-        payload = self._get_router_spec_payload(router_spec)
-        if description is not None:
-            payload["description"] = description
+        payload = self._create_router_payload(base_model, description)
         params = {"routerId": router_id}
-        resp = self.httpx.post("/routers", params=params, json=payload)
-        resp.raise_for_status()
-        return self._init_router(json_data=resp.json())
-
-    @staticmethod
-    def _get_model_executor(base_model, x, y):
-        return {
-            "point": {"x": x, "y": y},
-            "executor": {
-                "spec": {"executor_type": "ModelExecutor", "model_name": base_model}
-            },
-        }
+        # Create optimistically and let the API report duplicates, instead of a separate existence check.
+        resp = self.httpx.send(self._json_request("POST", "/routers", payload, params=params))
+        return self._created_router(router_id, resp)
 
     def update_router(
         self,
@@ -123,18 +363,9 @@ class RoutersClient:
             httpx.HTTPError: If the request fails.
             httpx.TimeoutException: If the request times out.
         """
-        if not self._is_router_exists(router_id):
-            raise exceptions.ResourceNotFoundError(
-                f"Router with id {router_id} not found"
-            )
-
-        payload = self._get_router_spec_payload(router_spec)
-        if description is not None:
-            payload["description"] = description
-
-        resp = self.httpx.patch(f"/routers/{router_id}", json=payload)
-        resp.raise_for_status()
-        return self._init_router(json_data=resp.json())
+        payload = self._update_router_payload(router_spec, description)
+        resp = self.httpx.send(self._json_request("PATCH", f"/routers/{router_id}", payload))
+        return self._updated_router(router_id, resp)
 
     def list(self) -> list[router_resource.Router]:
         """List all routers.
@@ -146,9 +377,26 @@ class RoutersClient:
             httpx.HTTPError: If the request fails.
             httpx.TimeoutException: If the request times out.
         """
-        resp = self.httpx.get("/routers")
-        resp.raise_for_status()
-        return [self._init_router(j) for j in resp.json()["routers"]]
+        return list(self.iter_routers())
+
+    def iter_routers(self) -> Iterator[router_resource.Router]:
+        """Iterate over all routers as the response arrives.
+
+        The response body is streamed and, when `ijson` is installed, parsed incrementally,
+        so memory stays flat however many routers the organization has.
+
+        Yields:
+            router_resource.Router: Each router, in the order returned by the API.
+
+        Raises:
+            httpx.HTTPError: If the request fails.
+            httpx.TimeoutException: If the request times out.
+        """
+        with self.httpx.stream("GET", "/routers") as resp:
+            resp.raise_for_status()
+            yield from map(
+                self._init_router, utils.iter_json_array(resp.iter_bytes(), "routers")
+            )
 
     def get(self, router_id: str, version=None) -> router_resource.Router:
         """Get a specific router by ID and optionally version.
@@ -165,16 +413,13 @@ class RoutersClient:
             httpx.HTTPError: If the request fails for reasons other than a missing router.
             httpx.TimeoutException: If the request times out.
         """
-        params = dict(version=version) if version else None
-        resp = self.httpx.get(f"/routers/{router_id}", params=params)
-
-        if resp.status_code == 404:
-            raise exceptions.ResourceNotFoundError(
-                f"Router with id {router_id} not found"
-            )
+        cache_key = ("get", router_id, version)
+        router = self._cache.get(cache_key)
+        if router is not None:
+            return router
 
-        resp.raise_for_status()
-        return self._init_router(resp.json())
+        resp = self.httpx.get(f"/routers/{router_id}", params=self._get_router_params(version))
+        return self._fetched_router(router_id, cache_key, resp)
 
     def run(
         self,
@@ -196,36 +441,63 @@ class RoutersClient:
 
         Raises:
             ResourceNotFoundError: If the router doesn't exist.
-            httpx.HTTPError: If the request fails.
-            httpx.TimeoutException: If the request times out.
+            openai.APIError: If the request fails.
+            openai.APITimeoutError: If the request times out.
         """
-        if not self._is_router_exists(router.id):
-            raise exceptions.ResourceNotFoundError(
-                f"Router with id {router.id} not found"
+        import openai
+
+        try:
+            return self._openai_client.chat.completions.create(
+                **self._completion_create_kwargs(
+                    router, routing_constraint, completion_request, version
+                )
             )
+        except openai.NotFoundError as e:
+            raise self._router_not_found(router) from e
 
-        openai_client = openai.OpenAI(
-            api_key=self.config.api_key,
-            base_url=self.config.openai_api_url,
-        )
+    def run_many(
+        self,
+        router: router_resource.Router,
+        routing_constraint: router_constraints.RoutingConstraint,
+        completion_requests: Iterable[Dict[str, Any]],
+        version: Optional[int] = None,
+        concurrency: int = _DEFAULT_RUN_CONCURRENCY,
+        return_exceptions: bool = False,
+    ) -> List[Union[chat_completion.ChatCompletion, Exception]]:
+        """Run a router on many completion requests, running the requests concurrently.
 
-        extra_body = {
-            **router_constraints.render_extra_body_router_constraint(routing_constraint)
-        }
-        if version is not None:
-            version_to_use = version
-        elif router.version is not None:
-            version_to_use = router.version
-        else:
-            version_to_use = "latest"
+        The runs are sent from a pool of worker threads sharing this client's connection pool,
+        so N runs take roughly N / concurrency round trips instead of N.
 
-        response = openai_client.chat.completions.create(
-            **completion_request
-            | {"model": f"{router.name}/versions/{version_to_use}"},
-            extra_body=extra_body,
-            timeout=self.config.evaluation_timeout,
-        )
-        return response
+        Args:
+            router (Router): The router to run.
+            routing_constraint (RoutingConstraint): The routing constraints to apply to every request.
+            completion_requests (Iterable[Dict[str, Any]]): The completion request parameters, one per run.
+            version (Optional[int], optional): Optional router version to use.
+            concurrency (int, optional): Maximum number of runs in flight at once. Defaults to 16.
+            return_exceptions (bool, optional): If True, a failed run's exception is returned in its
+                place instead of being raised. Defaults to False.
+
+        Returns:
+            List[Union[ChatCompletion, Exception]]: The router responses, in the same order as the requests.
+
+        Raises:
+            ResourceNotFoundError: If the router doesn't exist and return_exceptions is False.
+            openai.APIError: If a request fails and return_exceptions is False.
+        """
+
+        def run_request(completion_request):
+            try:
+                return self.run(
+                    router, routing_constraint, completion_request, version=version
+                )
+            except Exception as e:
+                if return_exceptions:
+                    return e
+                raise
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return list(executor.map(run_request, completion_requests))
 
     def run_training_job(
         self,
@@ -292,34 +564,9 @@ class RoutersClient:
             ...     requests=requests
             ... )
         """
-        if llms is None or not llms:
-            raise exceptions.InvalidParameterError(
-                "At least one LLM model name must be provided"
-            )
-        if not isinstance(llms, list):
-            raise exceptions.InvalidParameterError(
-                "llms param must be a list of strings"
-            )
-        llm_models = list(set(llms))
-
-        payload = {
-            "routerName": router.name,
-            "judgeName": judge.name,
-            "llms": llm_models,
-            "requests": requests,
-        }
-
-        resp = self.httpx.post("/router_training_jobs", json=payload)
-        resp.raise_for_status()
-        job = router_training_job.RouterTrainingJob.from_dict(resp.json())
-        _LOGGER.info(
-            "Started training job %s for router %s with judge %s and LLMs: %s",
-            job.name,
-            router.name,
-            judge.name,
-            llm_models,
-        )
-        return job
+        payload = self._training_job_payload(router, judge, llms, requests)
+        resp = self.httpx.send(self._json_request("POST", "/router_training_jobs", payload))
+        return self._started_training_job(resp, payload)
 
     def wait_training_job(
         self,
@@ -332,7 +579,9 @@ class RoutersClient:
         Args:
             job_name (str): The job name or ID. If it contains '/' it's treated as a full name
                 (e.g. 'organizations/org-name/router_training_jobs/job-id') and the last part is used as ID.
-            poll_interval (int, optional): Number of seconds to wait between polls. Defaults to 10.
+            poll_interval (int, optional): Maximum number of seconds to wait between polls. Polling starts
+                after about 1 second and backs off exponentially, with a little random jitter, up to this
+                interval. Defaults to 10.
             poll_timeout (int, optional): Maximum time to poll in seconds. Defaults to 1200 (20 minutes).
 
         Returns:
@@ -360,45 +609,14 @@ class RoutersClient:
             ...     print(f"Training failed with status: {final_job.status}")
         """
         # Extract job ID from full name if needed
-        job_id = job_name.split("/")[-1] if "/" in job_name else job_name
-
-        start_time = dt.datetime.now()
-        timeout_time = start_time + dt.timedelta(seconds=poll_timeout)
-
-        while True:
-            current_time = dt.datetime.now()
-            if current_time > timeout_time:
-                raise TimeoutError(
-                    f"Training job {job_id} did not complete within {poll_timeout} seconds"
-                )
+        job_id = job_name.rpartition("/")[2]
 
+        for delay in self._training_job_poll_delays(job_id, poll_interval, poll_timeout):
+            time.sleep(delay)
             job = self.poll_training_job(job_id)
-
-            elapsed = current_time - start_time
-            _LOGGER.info(
-                "Training job %s status: %s (elapsed: %s)", job_id, job.status, elapsed
-            )
-
-            if job.status == "FAILURE_WITHOUT_RETRY":
-                _LOGGER.info("Job failed. All attempts have been exhausted.")
-                if job.error_message:
-                    _LOGGER.error("Error message: %s", job.error_message)
-                _LOGGER.info("Retry count: %d", job.retry_count)
-
-            if job.status == "FAILURE":
-                _LOGGER.info("Job failed.")
-                if job.error_message:
-                    _LOGGER.error("Error message: %s", job.error_message)
-                _LOGGER.info("Retry count: %d", job.retry_count)
-
-            if job.status in ["SUCCESS", "FAILURE_WITHOUT_RETRY", "FAILURE"]:
-                _LOGGER.info(
-                    "Training job %s completed with status: %s", job_id, job.status
-                )
+            if self._is_training_job_finished(job_id, job):
                 return job
 
-            time.sleep(poll_interval)
-
     def poll_training_job(
         self,
         job_name: str,
@@ -419,7 +637,240 @@ class RoutersClient:
             httpx.HTTPError: If the request fails.
             httpx.TimeoutException: If the request times out.
         """
-        job_id = job_name.split("/")[-1] if "/" in job_name else job_name
-        resp = self.httpx.get(f"/router_training_jobs/{job_id}")
-        resp.raise_for_status()
-        return router_training_job.RouterTrainingJob.from_dict(resp.json())
+        job_id = job_name.rpartition("/")[2]
+        return self._training_job(self.httpx.get(f"/router_training_jobs/{job_id}"))
+
+
+@dataclasses.dataclass(frozen=True)
+class AsyncRoutersClient(_RoutersClientBase):
+    """The asyncio counterpart of RoutersClient.
+
+    Every method is a coroutine with the same arguments, return values, and errors as its
+    RoutersClient counterpart, so many router runs or training-job waits can overlap on one event loop,
+    e.g. with `asyncio.gather` or `run_many`.
+
+    Normally, you don't need to create an AsyncRoutersClient directly. Instead, use the AsyncMartianClient.routers property.
+
+    Args:
+        httpx (httpx.AsyncClient): The async HTTP client to use for the API.
+        config (utils.ClientConfig): The configuration for the API.
+        cache_ttl (float, optional): Number of seconds `get` results are cached. Defaults to 0,
+            which disables caching.
+    """
+
+    httpx: httpx.AsyncClient
+    config: utils.ClientConfig
+    cache_ttl: float = 0.0
+    _cache: utils.TTLCache = dataclasses.field(init=False, repr=False, compare=False)
+
+    @functools.cached_property
+    def _openai_client(self) -> openai.AsyncOpenAI:
+        import openai
+
+        return openai.AsyncOpenAI(
+            api_key=self.config.api_key,
+            base_url=self.config.openai_api_url,
+            http_client=self.httpx,
+        )
+
+    async def exists(self, router_id: str) -> bool:
+        """Check whether a router exists. See RoutersClient.exists."""
+        resp = await self.httpx.get(f"/routers/{router_id}")
+        return resp.status_code == 200
+
+    async def create_router(
+        self,
+        router_id: str,
+        base_model: str,
+        description: Optional[str] = None,
+    ) -> router_resource.Router:
+        """Create a router. See RoutersClient.create_router."""
+        payload = self._create_router_payload(base_model, description)
+        params = {"routerId": router_id}
+        resp = await self.httpx.send(
+            self._json_request("POST", "/routers", payload, params=params)
+        )
+        return self._created_router(router_id, resp)
+
+    async def update_router(
+        self,
+        router_id: str,
+        router_spec: Dict[str, Any],
+        description: Optional[str] = None,
+    ) -> router_resource.Router:
+        """Update an existing router's specification and/or description. See RoutersClient.update_router."""
+        payload = self._update_router_payload(router_spec, description)
+        resp = await self.httpx.send(
+            self._json_request("PATCH", f"/routers/{router_id}", payload)
+        )
+        return self._updated_router(router_id, resp)
+
+    async def list(self) -> list[router_resource.Router]:
+        """List all routers. See RoutersClient.list."""
+        return [router async for router in self.iter_routers()]
+
+    async def iter_routers(self) -> AsyncIterator[router_resource.Router]:
+        """Iterate over all routers as the response arrives. See RoutersClient.iter_routers."""
+        async with self.httpx.stream("GET", "/routers") as resp:
+            resp.raise_for_status()
+            async for json_data in utils.aiter_json_array(resp.aiter_bytes(), "routers"):
+                yield self._init_router(json_data)
+
+    async def get(self, router_id: str, version=None) -> router_resource.Router:
+        """Get a specific router by ID and optionally version. See RoutersClient.get."""
+        cache_key = ("get", router_id, version)
+        router = self._cache.get(cache_key)
+        if router is not None:
+            return router
+
+        resp = await self.httpx.get(
+            f"/routers/{router_id}", params=self._get_router_params(version)
+        )
+        return self._fetched_router(router_id, cache_key, resp)
+
+    async def run(
+        self,
+        router: router_resource.Router,
+        routing_constraint: router_constraints.RoutingConstraint,
+        completion_request: Dict[str, Any],
+        version: Optional[int] = None,
+    ) -> chat_completion.ChatCompletion:
+        """Run a router with the given constraints and completion request. See RoutersClient.run."""
+        import openai
+
+        try:
+            return await self._openai_client.chat.completions.create(
+                **self._completion_create_kwargs(
+                    router, routing_constraint, completion_request, version
+                )
+            )
+        except openai.NotFoundError as e:
+            raise self._router_not_found(router) from e
+
+    async def run_many(
+        self,
+        router: router_resource.Router,
+        routing_constraint: router_constraints.RoutingConstraint,
+        completion_requests: Iterable[Dict[str, Any]],
+        version: Optional[int] = None,
+        concurrency: int = _DEFAULT_RUN_CONCURRENCY,
+        return_exceptions: bool = False,
+    ) -> List[Union[chat_completion.ChatCompletion, Exception]]:
+        """Run a router on many completion requests concurrently.
+
+        Args:
+            router (Router): The router to run.
+            routing_constraint (RoutingConstraint): The routing constraints to apply to every request.
+            completion_requests (Iterable[Dict[str, Any]]): The completion request parameters, one per run.
+            version (Optional[int], optional): Optional router version to use.
+            concurrency (int, optional): Maximum number of runs in flight at once. Defaults to 16.
+            return_exceptions (bool, optional): If True, a failed run's exception is returned in its
+                place instead of being raised. Defaults to False.
+
+        Returns:
+            List[Union[ChatCompletion, Exception]]: The router responses, in the same order as the requests.
+
+        Raises:
+            ResourceNotFoundError: If the router doesn't exist and return_exceptions is False.
+            openai.APIError: If a request fails and return_exceptions is False.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run_request(completion_request):
+            async with semaphore:
+                return await self.run(
+                    router, routing_constraint, completion_request, version=version
+                )
+
+        return await asyncio.gather(
+            *(run_request(r) for r in completion_requests),
+            return_exceptions=return_exceptions,
+        )
+
+    async def run_training_job(
+        self,
+        router: router_resource.Router,
+        judge: judge_resource.Judge,
+        llms: List[str],
+        requests: List[Dict[str, Any]],
+    ) -> router_training_job.RouterTrainingJob:
+        """Train a router for a given set of models. See RoutersClient.run_training_job."""
+        payload = self._training_job_payload(router, judge, llms, requests)
+        resp = await self.httpx.send(
+            self._json_request("POST", "/router_training_jobs", payload)
+        )
+        return self._started_training_job(resp, payload)
+
+    async def wait_training_job(
+        self,
+        job_name: str,
+        poll_interval: int = 10,
+        poll_timeout: int = 20 * 60,  # 20 minutes in seconds
+    ) -> router_training_job.RouterTrainingJob:
+        """Poll a training job until it completes or fails. See RoutersClient.wait_training_job.
+
+        Waits with `asyncio.sleep`, so several jobs can be awaited concurrently.
+
+        Examples:
+            Start waiting in the background and keep working while the router trains:
+
+            >>> training_job = await client.routers.run_training_job(...)
+            >>> training_task = asyncio.create_task(
+            ...     client.routers.wait_training_job(training_job.name)
+            ... )
+            >>>
+            >>> # ... evaluate judges, run other routers, etc. ...
+            >>>
+            >>> final_job = await training_task
+            >>> final_job.status
+            'SUCCESS'
+        """
+        job_id = job_name.rpartition("/")[2]
+
+        for delay in self._training_job_poll_delays(job_id, poll_interval, poll_timeout):
+            await asyncio.sleep(delay)
+            job = await self.poll_training_job(job_id)
+            if self._is_training_job_finished(job_id, job):
+                return job
+
+    async def wait_training_jobs(
+        self,
+        job_names: Iterable[str],
+        poll_interval: int = 10,
+        poll_timeout: int = 20 * 60,  # 20 minutes in seconds
+        return_exceptions: bool = False,
+    ) -> List[Union[router_training_job.RouterTrainingJob, Exception]]:
+        """Poll several training jobs concurrently until each completes or fails.
+
+        Each job is polled on its own backoff schedule, as in `wait_training_job`, so a job that
+        finishes early stops being polled while the others keep going.
+
+        Args:
+            job_names (Iterable[str]): The job names or IDs.
+            poll_interval (int, optional): Maximum number of seconds to wait between polls of one job. Defaults to 10.
+            poll_timeout (int, optional): Maximum time to poll each job in seconds. Defaults to 1200 (20 minutes).
+            return_exceptions (bool, optional): If True, a failed wait's exception (e.g. TimeoutError) is
+                returned in its place instead of being raised. Defaults to False.
+
+        Returns:
+            List[Union[RouterTrainingJob, Exception]]: The final state of each job, in the same order as job_names.
+
+        Raises:
+            httpx.HTTPError: If any API request fails and return_exceptions is False.
+            TimeoutError: If a job doesn't complete within poll_timeout and return_exceptions is False.
+        """
+        return await asyncio.gather(
+            *(
+                self.wait_training_job(job_name, poll_interval, poll_timeout)
+                for job_name in job_names
+            ),
+            return_exceptions=return_exceptions,
+        )
+
+    async def poll_training_job(
+        self,
+        job_name: str,
+    ) -> router_training_job.RouterTrainingJob:
+        """Get the current status of a training job. See RoutersClient.poll_training_job."""
+        job_id = job_name.rpartition("/")[2]
+        return self._training_job(await self.httpx.get(f"/router_training_jobs/{job_id}"))
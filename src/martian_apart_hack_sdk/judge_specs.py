@@ -1,6 +1,7 @@
 """Specifications for judges."""
 
 import dataclasses
+import functools
 from typing import Any, Dict, Literal, Optional
 
 
@@ -98,6 +99,21 @@ class RubricJudgeSpec:
     extract_variables: Optional[Dict[str, Any]] = None
     extract_judgement: Optional[Dict[str, Any]] = None
 
+    def __hash__(self) -> int:
+        # The generated hash would fail on the dict fields, so hash only the scalar ones.
+        # Equal specs share these values, which keeps this consistent with __eq__.
+        return hash(
+            (
+                self.model_type,
+                self.rubric,
+                self.model,
+                self.min_score,
+                self.max_score,
+                self.prescript,
+                self.postscript,
+            )
+        )
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert the judge specification to a dictionary format suitable for API requests.
 
@@ -106,11 +122,21 @@ class RubricJudgeSpec:
 
         Returns:
             Dict[str, Any]: A dictionary containing all non-None attributes of this
-                specification, ready to be sent to the API.
+                specification, ready to be sent to the API. Each call returns a new
+                top-level dict; nested dicts are shared with this spec.
         """
-        result = dataclasses.asdict(self)
-        # Filter out None values.
-        return {k: v for k, v in result.items() if v is not None}
+        return dict(self._dict)
+
+    @functools.cached_property
+    def _dict(self) -> Dict[str, Any]:
+        # Shallow on purpose: dataclasses.asdict would deep-copy every field. Nested dicts
+        # (extract_variables, extract_judgement) are shared with this spec, not copied.
+        result = {}
+        for field in dataclasses.fields(self):
+            value = getattr(self, field.name)
+            if value is not None:
+                result[field.name] = value
+        return result
 
 
 # For backward compatibility and future extensibility, JudgeSpec is an alias for RubricJudgeSpec.
@@ -2,6 +2,9 @@
 
 import dataclasses
 import functools
+import importlib.util
+import threading
+from typing import Dict, Tuple
 
 import httpx
 
@@ -10,15 +13,103 @@ from martian_apart_hack_sdk.backend_clients import judges as judges_client
 from martian_apart_hack_sdk.backend_clients import organization as organization_client
 from martian_apart_hack_sdk.backend_clients import routers as routers_client
 
+# HTTP/2 lets concurrent requests share one connection, but needs the optional `h2` package
+# (see the `http2` extra).
+_HTTP2 = importlib.util.find_spec("h2") is not None
+_LIMITS = httpx.Limits(
+    max_connections=64, max_keepalive_connections=32, keepalive_expiry=60.0
+)
+# Clients handed out by MartianClient.get, keyed by their arguments. A client leaves on close().
+_SHARED_CLIENTS: Dict[Tuple, "MartianClient"] = {}
+_SHARED_CLIENTS_LOCK = threading.Lock()
+
 
 @dataclasses.dataclass(frozen=True)
-class MartianClient:
+class _MartianClientBase:
+    """Configuration and organization discovery shared by MartianClient and AsyncMartianClient."""
+
+    api_url: str
+    api_key: str
+    cache_ttl: float = 0.0
+
+    @functools.cached_property
+    def org_id(self) -> str:
+        """Get the organization ID from the API."""
+        response = self._root_client.get("/organizations")
+        if response.status_code != 200:
+            raise ValueError(
+                f"Failed to get org id: {response.status_code} {response.text}"
+            )
+        return utils.json_loads(response.content)[0]["uid"]
+
+    @functools.cached_property
+    def _headers(self) -> httpx.Headers:
+        # Encoded once and shared by every httpx client this instance creates.
+        return httpx.Headers(
+            {
+                "accept": "application/json",
+                "Content-Type": "application/json",
+                "Authorization": f"Bearer {self.api_key}",
+            }
+        )
+
+    @functools.cached_property
+    def _root_client(self) -> httpx.Client:
+        # Client at the API root, for requests made before the organization is known.
+        return httpx.Client(
+            base_url=self.api_url,
+            headers=self._headers,
+            follow_redirects=True,
+            transport=self._transport,
+            timeout=self._timeout,
+        )
+
+    @functools.cached_property
+    def _transport(self) -> httpx.HTTPTransport:
+        # One connection pool for every synchronous client, since they all talk to the same host.
+        return httpx.HTTPTransport(http2=_HTTP2, limits=_LIMITS)
+
+    @functools.cached_property
+    def _base_url(self) -> str:
+        """Get the base URL for API requests.
+
+        Returns:
+            str: The base URL in the format "{api_url}/v1/organizations/{org_id}".
+                For example, if api_url is "https://api.martian.com" and org_id is "my-org",
+                the base URL would be "https://api.martian.com/v1/organizations/my-org".
+        """
+        return f"{self.api_url}/v1/organizations/{self.org_id}"
+
+    @functools.cached_property
+    def _organization_url(self) -> str:
+        # Organization-level endpoints (e.g. credits) live outside the versioned API.
+        return f"{self.api_url}/organizations/{self.org_id}"
+
+    @functools.cached_property
+    def _timeout(self) -> httpx.Timeout:
+        # Reads may legitimately take as long as a judge evaluation; connecting should not.
+        return httpx.Timeout(
+            connect=5.0, read=self._config.evaluation_timeout, write=10.0, pool=5.0
+        )
+
+    @functools.cached_property
+    def _config(self) -> utils.ClientConfig:
+        return utils.ClientConfig(
+            api_url=self.api_url,
+            api_key=self.api_key,
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class MartianClient(_MartianClientBase):
     """The main client for the Martian SDK.
     Use the MartianClient to interact with the Judges and Routers Clients.
 
     Args:
         api_url (str): The base URL for the Martian API.
         api_key (str): The API key to use for authentication.
+        cache_ttl (float, optional): Number of seconds judge and router lookups are cached.
+            Defaults to 0, which disables caching so every lookup reflects the latest server state.
         org_id (Optional[str], optional): The organization ID to use for authentication. If not provided, the organization ID will be fetched from the API.
 
     Attributes:
@@ -28,10 +119,39 @@ class MartianClient:
 
     Notes:
         The MartianClient is a singleton. You should not create multiple instances of the MartianClient.
+        It can be used as a context manager (`with MartianClient(...) as client:`) to close its
+        connection pools on exit; otherwise call `close()` when done.
+        Use `MartianClient.get(...)` to share one instance per set of credentials.
     """
 
-    api_url: str
-    api_key: str
+    @classmethod
+    def get(
+        cls, api_url: str, api_key: str, cache_ttl: float = 0.0
+    ) -> "MartianClient":
+        """Get the shared client for these arguments, creating it on first use.
+
+        Repeated calls with the same arguments return the same instance, so its
+        organization lookup and connection pools are reused. Closing the shared client
+        removes it, and the next call creates a new one. Construct `MartianClient`
+        directly to get an independent client.
+
+        Args:
+            api_url (str): The base URL for the Martian API.
+            api_key (str): The API key to use for authentication.
+            cache_ttl (float, optional): Number of seconds judge and router lookups are cached.
+                Defaults to 0 (disabled).
+
+        Returns:
+            MartianClient: The shared client.
+        """
+        key = (cls, api_url, api_key, cache_ttl)
+        with _SHARED_CLIENTS_LOCK:
+            client = _SHARED_CLIENTS.get(key)
+            if client is None:
+                client = _SHARED_CLIENTS[key] = cls(
+                    api_url=api_url, api_key=api_key, cache_ttl=cache_ttl
+                )
+        return client
 
     @functools.cached_property
     def organization(self) -> organization_client.OrganizationClient:
@@ -43,64 +163,140 @@ class MartianClient:
     @functools.cached_property
     def judges(self) -> judges_client.JudgesClient:
         """Get the judges client."""
-        return judges_client.JudgesClient(self._client, self._config)
+        return judges_client.JudgesClient(
+            self._client, self._config, cache_ttl=self.cache_ttl
+        )
 
     @functools.cached_property
     def routers(self) -> routers_client.RoutersClient:
         """Get the routers client."""
-        return routers_client.RoutersClient(self._client, self._config)
-
-    @functools.cached_property
-    def org_id(self) -> str:
-        """Get the organization ID from the API."""
-        response = httpx.get(
-            f"{self.api_url}/organizations",
-            headers=self._headers(),
-            follow_redirects=True,
+        return routers_client.RoutersClient(
+            self._client, self._config, cache_ttl=self.cache_ttl
         )
-        if response.status_code != 200:
-            raise ValueError(
-                f"Failed to get org id: {response.status_code} {response.text}"
-            )
-        return response.json()[0]["uid"]
 
-    def _headers(self) -> dict[str, str]:
-        return {
-            "accept": "application/json",
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self.api_key}",
-        }
+    def close(self) -> None:
+        """Close the HTTP connection pool opened by this client.
 
-    @functools.cached_property
-    def _base_url(self) -> str:
-        """Get the base URL for API requests.
-
-        Returns:
-            str: The base URL in the format "{api_url}/v1/organizations/{org_id}".
-                For example, if api_url is "https://api.martian.com" and org_id is "my-org",
-                the base URL would be "https://api.martian.com/v1/organizations/my-org".
+        Only clients that were actually created are closed. Don't use the client afterwards;
+        if it came from `MartianClient.get`, later calls to `get` return a new client.
         """
-        return f"{self.api_url}/v1/organizations/{self.org_id}"
+        key = (type(self), self.api_url, self.api_key, self.cache_ttl)
+        with _SHARED_CLIENTS_LOCK:
+            if _SHARED_CLIENTS.get(key) is self:
+                del _SHARED_CLIENTS[key]
+        for name in ("_client", "_organization_client", "_root_client"):
+            http_client = self.__dict__.get(name)
+            if http_client is not None:
+                http_client.close()
+
+    def __enter__(self) -> "MartianClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     @functools.cached_property
     def _organization_client(self) -> httpx.Client:
         return httpx.Client(
-            base_url=f"{self.api_url}/organizations/{self.org_id}",
-            headers=self._headers(),
+            base_url=self._organization_url,
+            headers=self._headers,
             follow_redirects=True,
+            transport=self._transport,
+            timeout=self._timeout,
         )
 
     @functools.cached_property
     def _client(self) -> httpx.Client:
         return httpx.Client(
-            base_url=f"{self.api_url}/v1/organizations/{self.org_id}",
-            headers=self._headers(),
+            base_url=self._base_url,
+            headers=self._headers,
+            follow_redirects=True,
+            transport=self._transport,
+            timeout=self._timeout,
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class AsyncMartianClient(_MartianClientBase):
+    """The asyncio counterpart of MartianClient.
+
+    Its clients expose coroutines, so independent API calls (e.g. many judge evaluations)
+    can run concurrently with `asyncio.gather`.
+
+    Args:
+        api_url (str): The base URL for the Martian API.
+        api_key (str): The API key to use for authentication.
+        cache_ttl (float, optional): Number of seconds judge and router lookups are cached. Defaults to 0 (disabled).
+
+    Attributes:
+        organization (AsyncOrganizationClient): Async client for organization-specific operations like checking credits.
+        judges (AsyncJudgesClient): Async client for creating, updating, and evaluating judges.
+        routers (AsyncRoutersClient): Async client for creating, running, and training routers.
+
+    Notes:
+        The organization ID is still discovered with a single blocking request, the first time it is needed.
+        It can be used as an async context manager (`async with AsyncMartianClient(...) as client:`)
+        to close its connection pools on exit; otherwise await `aclose()` when done.
+    """
+
+    @functools.cached_property
+    def organization(self) -> organization_client.AsyncOrganizationClient:
+        """Get the async organization client."""
+        return organization_client.AsyncOrganizationClient(
+            self._organization_client, self._config
+        )
+
+    @functools.cached_property
+    def judges(self) -> judges_client.AsyncJudgesClient:
+        """Get the async judges client."""
+        return judges_client.AsyncJudgesClient(
+            self._client, self._config, cache_ttl=self.cache_ttl
+        )
+
+    @functools.cached_property
+    def routers(self) -> routers_client.AsyncRoutersClient:
+        """Get the async routers client."""
+        return routers_client.AsyncRoutersClient(
+            self._client, self._config, cache_ttl=self.cache_ttl
+        )
+
+    async def aclose(self) -> None:
+        """Close the HTTP connection pools opened by this client.
+
+        Only clients that were actually created are closed. Don't use the client afterwards.
+        """
+        for name in ("_client", "_organization_client"):
+            http_client = self.__dict__.get(name)
+            if http_client is not None:
+                await http_client.aclose()
+        root_client = self.__dict__.get("_root_client")
+        if root_client is not None:
+            root_client.close()
+
+    async def __aenter__(self) -> "AsyncMartianClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    @functools.cached_property
+    def _organization_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url=self._organization_url,
+            headers=self._headers,
             follow_redirects=True,
+            http2=_HTTP2,
+            limits=_LIMITS,
+            timeout=self._timeout,
         )
 
     @functools.cached_property
-    def _config(self) -> utils.ClientConfig:
-        return utils.ClientConfig(
-            api_url=self.api_url,
-            api_key=self.api_key,
+    def _client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url=self._base_url,
+            headers=self._headers,
+            follow_redirects=True,
+            http2=_HTTP2,
+            limits=_LIMITS,
+            timeout=self._timeout,
         )
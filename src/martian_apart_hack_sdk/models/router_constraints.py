@@ -1,6 +1,7 @@
 """Router constraints models."""
 
 import dataclasses
+import functools
 from typing import Optional
 
 @dataclasses.dataclass
@@ -85,8 +86,30 @@ class RoutingConstraint:
         return result
 
 
+def _constraint_values(constraint) -> Optional[tuple]:
+    # A hashable snapshot of a cost or quality constraint; the constraint itself is mutable.
+    if constraint is None:
+        return None
+    return (constraint.value.numeric_value, constraint.value.model_name)
+
+
+@functools.lru_cache(maxsize=32)
+def _render_extra_body(cost_values: Optional[tuple], quality_values: Optional[tuple]) -> dict:
+    routing_constraint = RoutingConstraint()
+    if cost_values is not None:
+        routing_constraint.cost_constraint = CostConstraint(ConstraintValue(*cost_values))
+    if quality_values is not None:
+        routing_constraint.quality_constraint = QualityConstraint(ConstraintValue(*quality_values))
+    return {
+        "routing_constraint": routing_constraint.to_dict()
+    }
+
+
 def render_extra_body_router_constraint(routing_constraint: RoutingConstraint) -> dict:
     """Render extra body for router constraint.
+
+    Rendering is cached by the constraint's current values, but every call returns new
+    dicts, so callers may modify the result.
     
     Args:
         routing_constraint: RoutingConstraint instance to render
@@ -94,6 +117,12 @@ def render_extra_body_router_constraint(routing_constraint: RoutingConstraint) -
     Returns:
         dict: Dictionary with routing_constraint field containing the constraint dict
     """
+    rendered = _render_extra_body(
+        _constraint_values(routing_constraint.cost_constraint),
+        _constraint_values(routing_constraint.quality_constraint),
+    )
     return {
-        "routing_constraint": routing_constraint.to_dict()
+        "routing_constraint": {
+            name: dict(value) for name, value in rendered["routing_constraint"].items()
+        }
     }
\ No newline at end of file
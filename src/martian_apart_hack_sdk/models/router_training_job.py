@@ -4,6 +4,8 @@ import dataclasses
 import datetime as dt
 from typing import Any, Dict, List, Optional
 
+from martian_apart_hack_sdk import utils
+
 
 @dataclasses.dataclass(frozen=True)
 class RouterTrainingJob:
@@ -25,7 +27,8 @@ class RouterTrainingJob:
         """Create a RouterTrainingJob instance from a dictionary.
 
         Args:
-            data: Dictionary containing the training job data
+            data: Dictionary containing the training job data. Its RFC 3339 timestamps are
+                parsed into datetimes here, once.
 
         Returns:
             RouterTrainingJob instance
@@ -36,8 +39,8 @@ class RouterTrainingJob:
             judge_name=data["judgeName"],
             judge_version=data["judgeVersion"],
             status=data["status"],
-            create_time=data["createTime"],
-            update_time=data["updateTime"],
+            create_time=utils.parse_timestamp(data["createTime"]),
+            update_time=utils.parse_timestamp(data["updateTime"]),
             llms=data["llms"],
             error_message=data.get("errorMessage"),
             retry_count=data.get("retryCount", 0),
@@ -5,8 +5,6 @@ from __future__ import annotations
 import dataclasses
 from typing import Any, Dict
 
-from openai.types.chat import chat_completion, chat_completion_message_param
-
 
 @dataclasses.dataclass(frozen=True, repr=True, eq=True, order=True)
 class Judge:
@@ -46,7 +44,7 @@ class Judge:
         "organizations/org-123/judges/my-judge", the ID would be "my-judge".
         """
         # Set id as the last segment after the last "/"
-        _id = self.name.rsplit("/", 1)[-1]
+        _id = self.name.rpartition("/")[2]
         object.__setattr__(self, "id", _id)
 
     # def refresh(self) -> Judge:
@@ -48,5 +48,5 @@ class Router:
         "organizations/org-123/routers/my-router", the ID would be "my-router".
         """
         # Set id as the last segment after the last "/"
-        _id = self.name.rsplit("/", 1)[-1]
+        _id = self.name.rpartition("/")[2]
         object.__setattr__(self, "id", _id) 
\ No newline at end of file
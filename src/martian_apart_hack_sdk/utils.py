@@ -1,11 +1,44 @@
 """Utility functions and classes for the SDK."""
 
+import collections
 import dataclasses
+import datetime as dt
+import functools
 import json
-import pathlib
-from typing import Any, Dict
+import os
+import re
+import threading
+import time
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    Optional,
+    Union,
+)
 
-import dotenv
+try:
+    import orjson
+except ImportError:  # Optional speedup, see the `speedups` extra.
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # Optional incremental parser, see the `streaming` extra.
+    ijson = None
+
+try:
+    import ciso8601
+except ImportError:  # Optional speedup, see the `speedups` extra.
+    ciso8601 = None
+
+# RFC 3339 fractional seconds may carry up to nanosecond precision and a "Z" suffix, neither
+# of which datetime.fromisoformat accepts before Python 3.11.
+_FRACTION_RE = re.compile(r"\.(\d+)")
 
 
 @dataclasses.dataclass(frozen=True)
@@ -14,9 +47,9 @@ class ClientConfig:
     api_key: str
     evaluation_timeout: int = 100
 
-    @property
+    @functools.cached_property
     def openai_api_url(self) -> str:
-        """Get the OpenAI API URL.
+        """Get the OpenAI API URL, computed once per config.
 
         Returns:
             str: The OpenAI API URL constructed from the base API URL
@@ -24,29 +57,42 @@ class ClientConfig:
         return f"{self.api_url}/openai/v2"
 
 
+@functools.lru_cache(maxsize=1)
 def load_config() -> ClientConfig:
-    # Try current directory first
-    config = dotenv.dotenv_values()
+    """Load the client configuration from the environment or a .env file.
+
+    MARTIAN_API_URL and MARTIAN_API_KEY are read from the process environment first;
+    the nearest .env file in the working directory or one of its parents is only located
+    and parsed when one of them is missing there.
+    The result is cached, so this lookup happens once per process.
+    Call `load_config.cache_clear()` to force a reload.
+
+    Returns:
+        ClientConfig: The configuration built from MARTIAN_API_URL and MARTIAN_API_KEY.
+
+    Raises:
+        ValueError: If MARTIAN_API_URL or MARTIAN_API_KEY is not set.
+    """
+    api_url = os.environ.get("MARTIAN_API_URL")
+    api_key = os.environ.get("MARTIAN_API_KEY")
 
-    # If not found, try parent directory
-    if not config:
-        parent_env = pathlib.Path("../.env")
-        if parent_env.exists():
-            config = dotenv.dotenv_values(parent_env)
+    if api_url is None or api_key is None:
+        # Only needed here, so keep it off the SDK import path.
+        import dotenv
 
-    # If still not found, try parent's parent directory
-    if not config:
-        parent_parent_env = pathlib.Path("../../.env")
-        if parent_parent_env.exists():
-            config = dotenv.dotenv_values(parent_parent_env)
+        # Use the nearest .env in the working directory or any of its parents.
+        env_file = dotenv.find_dotenv(usecwd=True)
+        config = dotenv.dotenv_values(env_file) if env_file else {}
 
-    api_url = config.get("MARTIAN_API_URL")
-    api_key = config.get("MARTIAN_API_KEY")
+        if api_url is None:
+            api_url = config.get("MARTIAN_API_URL")
+        if api_key is None:
+            api_key = config.get("MARTIAN_API_KEY")
 
     if api_url is None:
-        raise ValueError("MARTIAN_API_URL not set in .env")
+        raise ValueError("MARTIAN_API_URL not set in the environment or .env")
     if api_key is None:
-        raise ValueError("MARTIAN_API_KEY not set in .env")
+        raise ValueError("MARTIAN_API_KEY not set in the environment or .env")
 
     return ClientConfig(
         api_url=api_url,
@@ -63,4 +109,163 @@ def get_evaluation_json_payload(data: Dict[str, Any]) -> Dict[str, str]:
     Returns:
         Dictionary with jsonPayload field containing JSON string
     """
-    return {"jsonPayload": json.dumps(data)}
+    return {"jsonPayload": json_dumps(data)}
+
+
+def json_dumps(data: Any) -> str:
+    """Serialize data to a JSON string, using orjson when it is installed.
+
+    Args:
+        data: The JSON-compatible value to serialize.
+
+    Returns:
+        str: The JSON document.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            # orjson rejects a few inputs the stdlib accepts (e.g. integers wider than 64 bits).
+            pass
+    return json.dumps(data)
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """Parse a JSON document, using orjson when it is installed.
+
+    Args:
+        data: The JSON document, as text or UTF-8 encoded bytes.
+
+    Returns:
+        Any: The decoded value.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def parse_timestamp(value: str) -> dt.datetime:
+    """Parse an RFC 3339 timestamp, using ciso8601 when it is installed.
+
+    Args:
+        value: The timestamp, e.g. "2025-06-02T17:53:35.422529Z".
+
+    Returns:
+        datetime.datetime: The timezone-aware datetime. Precision beyond microseconds is dropped.
+
+    Raises:
+        ValueError: If `value` is not a valid timestamp.
+    """
+    if ciso8601 is not None:
+        return ciso8601.parse_datetime(value)
+    if value.endswith(("Z", "z")):
+        value = value[:-1] + "+00:00"
+    value = _FRACTION_RE.sub(
+        lambda match: "." + match.group(1)[:6].ljust(6, "0"), value, count=1
+    )
+    return dt.datetime.fromisoformat(value)
+
+
+def iter_json_array(chunks: Iterable[bytes], key: str) -> Iterator[Any]:
+    """Yield the items of the array stored under `key` in a JSON object received in chunks.
+
+    When `ijson` is installed, items are parsed and yielded as the chunks arrive, so memory
+    stays flat however long the array is. Otherwise the whole document is parsed once the
+    last chunk has been received.
+
+    Args:
+        chunks: The JSON document, as an iterable of byte chunks (e.g. `response.iter_bytes()`).
+        key: The top-level key holding the array.
+
+    Yields:
+        Any: Each decoded array item, in order.
+    """
+    if ijson is None:
+        yield from json_loads(b"".join(chunks))[key]
+        return
+
+    parsed = ijson.sendable_list()
+    parser = ijson.items_coro(parsed, f"{key}.item", use_float=True)
+    for chunk in chunks:
+        parser.send(chunk)
+        yield from parsed
+        del parsed[:]
+    parser.close()
+    yield from parsed
+
+
+async def aiter_json_array(chunks: AsyncIterable[bytes], key: str) -> AsyncIterator[Any]:
+    """Async counterpart of `iter_json_array`, for chunks from e.g. `response.aiter_bytes()`.
+
+    Args:
+        chunks: The JSON document, as an async iterable of byte chunks.
+        key: The top-level key holding the array.
+
+    Yields:
+        Any: Each decoded array item, in order.
+    """
+    if ijson is None:
+        for item in json_loads(b"".join([chunk async for chunk in chunks]))[key]:
+            yield item
+        return
+
+    parsed = ijson.sendable_list()
+    parser = ijson.items_coro(parsed, f"{key}.item", use_float=True)
+    async for chunk in chunks:
+        parser.send(chunk)
+        for item in parsed:
+            yield item
+        del parsed[:]
+    parser.close()
+    for item in parsed:
+        yield item
+
+
+class TTLCache:
+    """A small thread-safe cache whose entries expire after a fixed time-to-live.
+
+    Used by the backend clients to avoid refetching resources that rarely change
+    within a short window. When the cache is full, the oldest entry is evicted.
+
+    Args:
+        ttl (float, optional): Number of seconds an entry stays valid. Defaults to 30.
+            A ttl of 0 (or less) disables the cache: nothing is stored.
+        maxsize (int, optional): Maximum number of entries kept. Defaults to 128.
+    """
+
+    def __init__(self, ttl: float = 30.0, maxsize: int = 128):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Return the cached value for `key`, or `default` if it is missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store `value` under `key` for the next `ttl` seconds (the cache's default if not given).
+
+        Does nothing when the cache is disabled.
+        """
+        if self.ttl <= 0:
+            return
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (expires_at, value)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
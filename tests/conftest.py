@@ -0,0 +1,37 @@
+"""Shared fixtures for the SDK tests."""
+
+import pytest
+from openai.types.chat import chat_completion, chat_completion_message
+
+import mock_api
+from martian_apart_hack_sdk import utils
+from martian_apart_hack_sdk.resources import judge as judge_resource
+
+
+@pytest.fixture
+def config():
+    return utils.ClientConfig(api_url=mock_api.API_URL, api_key="test-key")
+
+
+@pytest.fixture
+def judge():
+    return judge_resource.Judge(**{**mock_api.judge_json("judge-1"), "judgeSpec": {}})
+
+
+@pytest.fixture
+def completion():
+    return chat_completion.ChatCompletion(
+        id="completion-1",
+        choices=[
+            chat_completion.Choice(
+                finish_reason="stop",
+                index=0,
+                message=chat_completion_message.ChatCompletionMessage(
+                    role="assistant", content="Paris"
+                ),
+            )
+        ],
+        created=0,
+        model="openai/openai/gpt-4o",
+        object="chat.completion",
+    )
@@ -0,0 +1,79 @@
+"""Canned API payloads and mock HTTP clients for the SDK tests."""
+
+import httpx
+
+API_URL = "https://api.example.test"
+
+
+def judge_json(judge_id, version=1):
+    return {
+        "name": f"organizations/org/judges/{judge_id}",
+        "version": version,
+        "description": "A judge",
+        "createTime": "2025-06-02T17:53:35.422529Z",
+        "judgeSpec": {"judgeSpec": {"model_type": "rubric_judge"}},
+    }
+
+
+def router_json(router_id, version=1):
+    return {
+        "name": f"organizations/org/routers/{router_id}",
+        "version": version,
+        "description": "A router",
+        "createTime": "2025-06-02T17:53:35.422529Z",
+        "routerSpec": {"points": []},
+    }
+
+
+def training_job_json(status, job_id="job-1"):
+    return {
+        "name": f"organizations/org/router_training_jobs/{job_id}",
+        "routerName": "organizations/org/routers/router-1",
+        "judgeName": "organizations/org/judges/judge-1",
+        "judgeVersion": 1,
+        "status": status,
+        "createTime": "2025-06-02T17:53:35.422529Z",
+        "updateTime": "2025-06-02T17:53:35.422529Z",
+        "llms": ["openai/openai/gpt-4o"],
+    }
+
+
+class Responses:
+    """A MockTransport handler replaying `outcomes` (responses or exceptions) in order."""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.requests = []
+
+    def __call__(self, request):
+        self.requests.append(request)
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+class Recorder:
+    """A MockTransport handler answering each request with `respond(request)`, in any order."""
+
+    def __init__(self, respond):
+        self.respond = respond
+        self.requests = []
+
+    def __call__(self, request):
+        self.requests.append(request)
+        return self.respond(request)
+
+
+def sync_client(handler):
+    """An httpx.Client that answers every request with `handler`."""
+    return httpx.Client(base_url=API_URL, transport=httpx.MockTransport(handler))
+
+
+def async_client(handler):
+    """An httpx.AsyncClient that answers every request with `handler`."""
+
+    async def async_handler(request):
+        return handler(request)
+
+    return httpx.AsyncClient(base_url=API_URL, transport=httpx.MockTransport(async_handler))
@@ -0,0 +1,383 @@
+"""Tests for the judges API clients."""
+
+import asyncio
+import json
+import threading
+import time
+
+import httpx
+import pytest
+
+from mock_api import Recorder, Responses, async_client, judge_json, sync_client
+from martian_apart_hack_sdk import exceptions, judge_specs
+from martian_apart_hack_sdk.backend_clients import judges
+
+COMPLETION_REQUEST = {"model": "openai/openai/gpt-4o", "messages": []}
+JUDGEMENT = {"judgement": {"score": 4.0, "reason": "Good", "cost": 0.01}}
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    delays = []
+    monkeypatch.setattr(judges.time, "sleep", delays.append)
+
+    async def fake_async_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(judges.asyncio, "sleep", fake_async_sleep)
+    return delays
+
+
+def evaluate(config, judge, completion, handler):
+    client = judges.JudgesClient(sync_client(handler), config)
+    return client.evaluate(judge, COMPLETION_REQUEST, completion)
+
+
+def test_evaluate_retries_rate_limited_requests(config, judge, completion, sleeps):
+    handler = Responses(
+        httpx.Response(429, headers={"Retry-After": "3"}),
+        httpx.Response(429),
+        httpx.Response(200, json=JUDGEMENT),
+    )
+
+    evaluation = evaluate(config, judge, completion, handler)
+
+    assert evaluation.score == 4.0
+    assert len(handler.requests) == 3
+    assert sleeps == [3.0, 2.0]
+    assert handler.requests[0].content == handler.requests[2].content
+
+
+def test_evaluate_retries_unavailable_only_with_retry_after(
+    config, judge, completion, sleeps
+):
+    handler = Responses(
+        httpx.Response(503, headers={"Retry-After": "1"}),
+        httpx.Response(503),
+    )
+
+    with pytest.raises(httpx.HTTPStatusError):
+        evaluate(config, judge, completion, handler)
+    assert len(handler.requests) == 2
+    assert sleeps == [1.0]
+
+
+@pytest.mark.parametrize("status_code", [408, 500, 502, 504])
+def test_evaluate_does_not_retry_requests_that_may_have_run(
+    config, judge, completion, sleeps, status_code
+):
+    handler = Responses(httpx.Response(status_code))
+
+    with pytest.raises(httpx.HTTPStatusError):
+        evaluate(config, judge, completion, handler)
+    assert len(handler.requests) == 1
+    assert sleeps == []
+
+
+def test_evaluate_retries_connection_failures(config, judge, completion, sleeps):
+    handler = Responses(
+        httpx.ConnectError("refused"),
+        httpx.ConnectTimeout("timed out"),
+        httpx.Response(200, json=JUDGEMENT),
+    )
+
+    assert evaluate(config, judge, completion, handler).score == 4.0
+    assert sleeps == [1.0, 2.0]
+
+
+@pytest.mark.parametrize(
+    "error", [httpx.RemoteProtocolError("disconnected"), httpx.ReadTimeout("slow")]
+)
+def test_evaluate_does_not_retry_errors_after_sending(
+    config, judge, completion, sleeps, error
+):
+    handler = Responses(error)
+
+    with pytest.raises(type(error)):
+        evaluate(config, judge, completion, handler)
+    assert len(handler.requests) == 1
+    assert sleeps == []
+
+
+def test_evaluate_gives_up_after_max_attempts(config, judge, completion, sleeps):
+    handler = Responses(*[httpx.Response(429)] * judges._EVALUATION_ATTEMPTS)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        evaluate(config, judge, completion, handler)
+    assert len(handler.requests) == judges._EVALUATION_ATTEMPTS
+    assert sleeps == [1.0, 2.0, 4.0, 8.0]
+
+
+def test_retry_after_is_capped(config, judge, completion, sleeps):
+    handler = Responses(
+        httpx.Response(429, headers={"Retry-After": "3600"}),
+        httpx.Response(200, json=JUDGEMENT),
+    )
+
+    evaluate(config, judge, completion, handler)
+    assert sleeps == [judges._MAX_RETRY_DELAY]
+
+
+def test_async_evaluate_retries_like_sync(config, judge, completion, sleeps):
+    handler = Responses(
+        httpx.ConnectError("refused"),
+        httpx.Response(429),
+        httpx.Response(500),
+    )
+    client = judges.AsyncJudgesClient(async_client(handler), config)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(client.evaluate(judge, COMPLETION_REQUEST, completion))
+    assert len(handler.requests) == 3
+    assert sleeps == [1.0, 2.0]
+
+
+def test_get_is_not_cached_by_default(config):
+    handler = Responses(
+        httpx.Response(200, json=judge_json("judge-1", version=1)),
+        httpx.Response(200, json=judge_json("judge-1", version=2)),
+    )
+    client = judges.JudgesClient(sync_client(handler), config)
+
+    assert client.get("judge-1").version == 1
+    assert client.get("judge-1").version == 2
+
+
+def test_get_and_list_are_cached_when_enabled(config, monkeypatch):
+    handler = Responses(
+        httpx.Response(200, json=judge_json("judge-1")),
+        httpx.Response(200, json={"judges": [judge_json("judge-1")]}),
+        httpx.Response(200, json=judge_json("judge-1", version=2)),
+    )
+    client = judges.JudgesClient(sync_client(handler), config, cache_ttl=30)
+
+    assert client.get("judge-1") is client.get("judge-1")
+    assert client.list() == client.list()
+    assert len(handler.requests) == 2
+
+    now = judges.utils.time.monotonic()
+    monkeypatch.setattr(judges.utils.time, "monotonic", lambda: now + 31)
+    assert client.get("judge-1").version == 2
+
+
+def test_update_refreshes_cached_judge(config):
+    handler = Responses(
+        httpx.Response(200, json=judge_json("judge-1", version=1)),
+        httpx.Response(200, json=judge_json("judge-1", version=2)),
+    )
+    client = judges.JudgesClient(sync_client(handler), config, cache_ttl=30)
+    client.get("judge-1")
+
+    spec = judge_specs.RubricJudgeSpec(
+        model_type="rubric_judge", rubric="r", model="m", min_score=0, max_score=1
+    )
+    client.update_judge("judge-1", spec)
+
+    assert client.get("judge-1").version == 2
+    assert len(handler.requests) == 2
+
+
+def test_create_judge_reports_duplicates(config):
+    handler = Responses(
+        httpx.Response(200, json=judge_json("judge-1")),
+        httpx.Response(409),
+    )
+    client = judges.JudgesClient(sync_client(handler), config)
+    spec = judge_specs.RubricJudgeSpec(
+        model_type="rubric_judge", rubric="r", model="m", min_score=0, max_score=1
+    )
+
+    assert client.create_judge("judge-1", spec).id == "judge-1"
+    assert handler.requests[0].url.params["judgeId"] == "judge-1"
+    with pytest.raises(exceptions.ResourceAlreadyExistsError):
+        client.create_judge("judge-1", spec)
+
+
+def test_async_create_judge_reports_duplicates(config):
+    client = judges.AsyncJudgesClient(async_client(Responses(httpx.Response(409))), config)
+    spec = judge_specs.RubricJudgeSpec(
+        model_type="rubric_judge", rubric="r", model="m", min_score=0, max_score=1
+    )
+
+    with pytest.raises(exceptions.ResourceAlreadyExistsError):
+        asyncio.run(client.create_judge("judge-1", spec))
+
+
+def test_exists_always_asks_the_api(config):
+    handler = Responses(
+        httpx.Response(200, json=judge_json("judge-1")),
+        httpx.Response(404),
+    )
+    client = judges.JudgesClient(sync_client(handler), config, cache_ttl=30)
+    client.get("judge-1")
+
+    assert client.exists("judge-1") is False
+
+
+def test_judge_spec_to_dict_returns_a_copy():
+    spec = judge_specs.RubricJudgeSpec(
+        model_type="rubric_judge", rubric="r", model="m", min_score=0, max_score=1
+    )
+    spec.to_dict()["rubric"] = "changed"
+
+    assert spec.to_dict()["rubric"] == "r"
+
+
+def test_async_get_versions_streams_and_reports_unknown_judges(config):
+    handler = Responses(
+        httpx.Response(200, json={"judges": [judge_json("judge-1", 2), judge_json("judge-1", 1)]}),
+        httpx.Response(200, json={"judges": []}),
+    )
+    client = judges.AsyncJudgesClient(async_client(handler), config)
+
+    versions = asyncio.run(client.get_versions("judge-1"))
+    assert [judge.version for judge in versions] == [2, 1]
+    with pytest.raises(exceptions.ResourceNotFoundError):
+        asyncio.run(client.get_versions("judge-1"))
+
+
+def judge_lookups(request):
+    judge_id = request.url.path.rpartition("/")[2]
+    if judge_id == "missing":
+        return httpx.Response(404)
+    return httpx.Response(200, json=judge_json(judge_id))
+
+
+def test_get_many_fetches_each_judge_once_in_order(config):
+    handler = Recorder(judge_lookups)
+    client = judges.JudgesClient(sync_client(handler), config)
+
+    found = client.get_many(["judge-2", "judge-1", "judge-2", "missing"], return_exceptions=True)
+
+    assert [judge.id for judge in found[:3]] == ["judge-2", "judge-1", "judge-2"]
+    assert isinstance(found[3], exceptions.ResourceNotFoundError)
+    assert sorted(request.url.path for request in handler.requests) == [
+        "/judges/judge-1",
+        "/judges/judge-2",
+        "/judges/missing",
+    ]
+    with pytest.raises(exceptions.ResourceNotFoundError):
+        client.get_many(["judge-1", "missing"])
+
+
+def test_async_get_many_fetches_each_judge_once_in_order(config):
+    handler = Recorder(judge_lookups)
+    client = judges.AsyncJudgesClient(async_client(handler), config)
+
+    found = asyncio.run(client.get_many(["judge-1", "judge-1", "missing"], return_exceptions=True))
+
+    assert [judge.id for judge in found[:2]] == ["judge-1", "judge-1"]
+    assert isinstance(found[2], exceptions.ResourceNotFoundError)
+    assert len(handler.requests) == 2
+    with pytest.raises(exceptions.ResourceNotFoundError):
+        asyncio.run(client.get_many(["missing"]))
+
+
+def question_request(question):
+    return {**COMPLETION_REQUEST, "messages": [{"role": "user", "content": question}]}
+
+
+def score_questions(request):
+    # Scores each evaluation with its question (a number), and fails the question "bad".
+    payload = json.loads(request.content)
+    completion_request = json.loads(payload["completionCreateParams"]["jsonPayload"])
+    question = completion_request["messages"][0]["content"]
+    if question == "bad":
+        return httpx.Response(400)
+    return httpx.Response(
+        200, json={"judgement": {"score": float(question), "reason": question}}
+    )
+
+
+def test_evaluate_many_keeps_order_and_per_item_errors(config, judge, completion):
+    client = judges.JudgesClient(sync_client(Recorder(score_questions)), config)
+    pairs = [(question_request(q), completion) for q in ["3", "bad", "1", "2"]]
+
+    results = client.evaluate_many(judge, pairs, concurrency=2, return_exceptions=True)
+
+    assert [r.score for r in results if not isinstance(r, Exception)] == [3.0, 1.0, 2.0]
+    assert isinstance(results[1], httpx.HTTPStatusError)
+    with pytest.raises(httpx.HTTPStatusError):
+        client.evaluate_many(judge, pairs)
+
+
+def test_async_evaluate_many_keeps_order_and_per_item_errors(config, judge, completion):
+    client = judges.AsyncJudgesClient(async_client(Recorder(score_questions)), config)
+    pairs = [(question_request(q), completion) for q in ["2", "bad", "1"]]
+
+    results = asyncio.run(client.evaluate_many(judge, pairs, concurrency=2, return_exceptions=True))
+
+    assert results[0].score == 2.0 and results[2].score == 1.0
+    assert isinstance(results[1], httpx.HTTPStatusError)
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(client.evaluate_many(judge, pairs))
+
+
+def test_get_many_limits_requests_in_flight(config):
+    lock = threading.Lock()
+    in_flight = [0]
+    peak = [0]
+
+    def slow_lookup(request):
+        with lock:
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+        time.sleep(0.01)
+        with lock:
+            in_flight[0] -= 1
+        return judge_lookups(request)
+
+    client = judges.JudgesClient(sync_client(slow_lookup), config)
+    judge_ids = [f"judge-{i}" for i in range(12)]
+
+    found = client.get_many(judge_ids, concurrency=3)
+
+    assert [judge.id for judge in found] == judge_ids
+    assert 1 < peak[0] <= 3
+
+
+def score_judge_versions(request):
+    # Scores each evaluation with the judge's version, and fails judges called "broken".
+    if request.url.path.startswith("/judges/broken"):
+        return httpx.Response(400)
+    version = json.loads(request.content)["judgeVersion"]
+    return httpx.Response(200, json={"judgement": {"score": float(version), "reason": "ok"}})
+
+
+def versioned_judges(*specs):
+    return [
+        judges.judge_resource.Judge(**{**judge_json(judge_id, version), "judgeSpec": {}})
+        for judge_id, version in specs
+    ]
+
+
+def test_evaluate_with_judges_keeps_order_and_per_judge_errors(config, completion):
+    handler = Recorder(score_judge_versions)
+    client = judges.JudgesClient(sync_client(handler), config)
+    judge_list = versioned_judges(("judge-a", 3), ("broken", 1), ("judge-b", 1))
+
+    results = client.evaluate_with_judges(
+        judge_list, COMPLETION_REQUEST, completion, return_exceptions=True
+    )
+
+    assert results[0].score == 3.0 and results[2].score == 1.0
+    assert isinstance(results[1], httpx.HTTPStatusError)
+    # Every judge is sent the same serialized completion.
+    completions = {
+        json.loads(request.content)["chatCompletion"]["jsonPayload"] for request in handler.requests
+    }
+    assert len(completions) == 1
+    with pytest.raises(httpx.HTTPStatusError):
+        client.evaluate_with_judges(judge_list, COMPLETION_REQUEST, completion)
+
+
+def test_async_evaluate_with_judges_keeps_order_and_per_judge_errors(config, completion):
+    client = judges.AsyncJudgesClient(async_client(Recorder(score_judge_versions)), config)
+    judge_list = versioned_judges(("broken", 1), ("judge-a", 2))
+
+    results = asyncio.run(
+        client.evaluate_with_judges(judge_list, COMPLETION_REQUEST, completion, return_exceptions=True)
+    )
+
+    assert isinstance(results[0], httpx.HTTPStatusError)
+    assert results[1].score == 2.0
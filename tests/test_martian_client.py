@@ -0,0 +1,98 @@
+"""Tests for the top-level Martian clients."""
+
+import asyncio
+import concurrent.futures
+
+import httpx
+
+from martian_apart_hack_sdk import martian_client
+from martian_apart_hack_sdk.backend_clients import judges, routers
+from mock_api import API_URL, Recorder, async_client, sync_client
+
+
+def organizations(request):
+    return httpx.Response(200, json=[{"uid": "org-1"}])
+
+
+def test_get_shares_one_client_per_arguments():
+    client = martian_client.MartianClient.get(API_URL, "key-1")
+    try:
+        assert martian_client.MartianClient.get(api_url=API_URL, api_key="key-1") is client
+        assert martian_client.MartianClient.get(API_URL, "key-1", cache_ttl=0.0) is client
+        assert martian_client.MartianClient.get(API_URL, "key-2") is not client
+        assert martian_client.MartianClient.get(API_URL, "key-1", cache_ttl=30) is not client
+    finally:
+        for shared in list(martian_client._SHARED_CLIENTS.values()):
+            shared.close()
+
+
+def test_closed_clients_are_not_handed_out_again():
+    client = martian_client.MartianClient.get(API_URL, "key-1")
+    client.close()
+
+    fresh = martian_client.MartianClient.get(API_URL, "key-1")
+    assert fresh is not client
+    fresh.close()
+    assert not martian_client._SHARED_CLIENTS
+
+
+def test_closing_an_independent_client_keeps_the_shared_one():
+    shared = martian_client.MartianClient.get(API_URL, "key-1")
+    martian_client.MartianClient(API_URL, "key-1").close()
+
+    assert martian_client.MartianClient.get(API_URL, "key-1") is shared
+    shared.close()
+
+
+def test_get_creates_one_client_under_concurrent_calls():
+    def get_client(_):
+        return martian_client.MartianClient.get(API_URL, "key-1")
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        clients = list(executor.map(get_client, range(32)))
+
+    assert all(client is clients[0] for client in clients)
+    clients[0].close()
+
+
+def test_close_removes_the_client_and_closes_its_connections():
+    client = martian_client.MartianClient.get(API_URL, "key-1")
+    client.__dict__["_root_client"] = sync_client(Recorder(organizations))
+    client.__dict__["_client"] = sync_client(Recorder(organizations))
+    http_clients = [client._root_client, client._client]
+
+    with client:
+        assert client.org_id == "org-1"
+        assert martian_client._SHARED_CLIENTS
+
+    assert not martian_client._SHARED_CLIENTS
+    assert all(http_client.is_closed for http_client in http_clients)
+    # Clients that were never used are not created just to be closed.
+    assert "_organization_client" not in client.__dict__
+
+
+def test_async_client_exposes_async_clients_with_its_cache_ttl():
+    client = martian_client.AsyncMartianClient(API_URL, "key-1", cache_ttl=30)
+    client.__dict__["_client"] = async_client(Recorder(organizations))
+
+    assert isinstance(client.judges, judges.AsyncJudgesClient)
+    assert isinstance(client.routers, routers.AsyncRoutersClient)
+    assert client.judges.httpx is client._client
+    assert client.judges.cache_ttl == client.routers.cache_ttl == 30
+    assert client.judges.config is client.routers.config
+
+
+def test_async_client_closes_its_connections_on_exit():
+    client = martian_client.AsyncMartianClient(API_URL, "key-1")
+    client.__dict__["_root_client"] = sync_client(Recorder(organizations))
+    client.__dict__["_client"] = async_client(Recorder(organizations))
+    http_clients = [client._root_client, client._client]
+
+    async def use_client():
+        async with client:
+            client.org_id
+
+    asyncio.run(use_client())
+
+    assert all(http_client.is_closed for http_client in http_clients)
+    assert "_organization_client" not in client.__dict__
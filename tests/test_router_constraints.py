@@ -0,0 +1,45 @@
+"""Tests for the routing constraint models."""
+
+from martian_apart_hack_sdk.models import router_constraints as c
+
+
+def cost_constraint(value):
+    return c.RoutingConstraint(cost_constraint=c.CostConstraint(c.ConstraintValue(numeric_value=value)))
+
+
+def test_constraints_are_mutable():
+    constraint = cost_constraint(0.5)
+    constraint.cost_constraint.value.numeric_value = 0.2
+
+    assert constraint.to_dict() == {"cost_constraint": {"numeric_value": 0.2}}
+
+
+def test_to_dict_returns_a_fresh_dict():
+    constraint = cost_constraint(0.5)
+    constraint.to_dict()["cost_constraint"]["numeric_value"] = 1.0
+
+    assert constraint.to_dict() == {"cost_constraint": {"numeric_value": 0.5}}
+
+
+def test_render_follows_mutated_constraints():
+    constraint = cost_constraint(0.5)
+    assert c.render_extra_body_router_constraint(constraint) == {
+        "routing_constraint": {"cost_constraint": {"numeric_value": 0.5}}
+    }
+
+    constraint.cost_constraint = None
+    constraint.quality_constraint = c.QualityConstraint(c.ConstraintValue(model_name="openai/openai/gpt-4o"))
+    assert c.render_extra_body_router_constraint(constraint) == {
+        "routing_constraint": {"quality_constraint": {"model_name": "openai/openai/gpt-4o"}}
+    }
+
+
+def test_render_returns_fresh_dicts():
+    constraint = cost_constraint(0.5)
+    rendered = c.render_extra_body_router_constraint(constraint)
+    rendered["routing_constraint"]["cost_constraint"]["numeric_value"] = 1.0
+    rendered["extra"] = True
+
+    assert c.render_extra_body_router_constraint(constraint) == {
+        "routing_constraint": {"cost_constraint": {"numeric_value": 0.5}}
+    }
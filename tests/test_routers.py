@@ -0,0 +1,226 @@
+"""Tests for the routers API clients."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from mock_api import Recorder, Responses, async_client, router_json, sync_client, training_job_json
+from martian_apart_hack_sdk import exceptions
+from martian_apart_hack_sdk.backend_clients import routers
+from martian_apart_hack_sdk.models import router_constraints
+from martian_apart_hack_sdk.resources import router as router_resource
+
+
+class SleepingClock:
+    """A monotonic clock that only moves when something sleeps on it."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, delay):
+        self.sleeps.append(delay)
+        self.now += delay
+
+    async def async_sleep(self, delay):
+        self.sleep(delay)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = SleepingClock()
+    monkeypatch.setattr(routers.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(routers.time, "sleep", clock.sleep)
+    monkeypatch.setattr(routers.asyncio, "sleep", clock.async_sleep)
+    # No jitter, so the backoff schedule is exact.
+    monkeypatch.setattr(routers.random, "uniform", lambda low, high: 1.0)
+    return clock
+
+
+def training_job_responses(*statuses):
+    return Responses(*(httpx.Response(200, json=training_job_json(status)) for status in statuses))
+
+
+def test_get_is_not_cached_by_default(config):
+    handler = Responses(
+        httpx.Response(200, json=router_json("router-1", version=1)),
+        httpx.Response(200, json=router_json("router-1", version=2)),
+    )
+    client = routers.RoutersClient(sync_client(handler), config)
+
+    assert client.get("router-1").version == 1
+    assert client.get("router-1").version == 2
+
+
+def test_get_is_cached_when_enabled(config, monkeypatch):
+    handler = Responses(
+        httpx.Response(200, json=router_json("router-1")),
+        httpx.Response(200, json=router_json("router-1", version=2)),
+    )
+    client = routers.RoutersClient(sync_client(handler), config, cache_ttl=30)
+
+    assert client.get("router-1") is client.get("router-1")
+    assert len(handler.requests) == 1
+
+    now = routers.utils.time.monotonic()
+    monkeypatch.setattr(routers.utils.time, "monotonic", lambda: now + 31)
+    assert client.get("router-1").version == 2
+
+
+def test_exists_always_asks_the_api(config):
+    handler = Responses(
+        httpx.Response(404),
+        httpx.Response(200, json=router_json("router-1")),
+        httpx.Response(200, json=router_json("router-1")),
+    )
+    client = routers.RoutersClient(sync_client(handler), config, cache_ttl=30)
+
+    assert client.exists("router-1") is False
+    assert client.exists("router-1") is True
+    client.get("router-1")
+    assert len(handler.requests) == 3
+
+
+def test_async_exists_always_asks_the_api(config):
+    handler = Responses(
+        httpx.Response(200, json=router_json("router-1")),
+        httpx.Response(404),
+    )
+    client = routers.AsyncRoutersClient(async_client(handler), config, cache_ttl=30)
+
+    async def check():
+        await client.get("router-1")
+        return await client.exists("router-1")
+
+    assert asyncio.run(check()) is False
+    assert len(handler.requests) == 2
+
+
+def test_poll_jitter_never_exceeds_poll_interval(monkeypatch):
+    monkeypatch.setattr(routers.random, "uniform", lambda low, high: high)
+    assert routers.RoutersClient._with_jitter(10.0, poll_interval=10) == 10
+
+    monkeypatch.setattr(routers.random, "uniform", lambda low, high: low)
+    assert routers.RoutersClient._with_jitter(10.0, poll_interval=10) == 9
+
+
+def test_wait_training_job_backs_off_up_to_poll_interval(config, clock):
+    handler = training_job_responses("RUNNING", "RUNNING", "RUNNING", "RUNNING", "SUCCESS")
+    client = routers.RoutersClient(sync_client(handler), config)
+
+    job = client.wait_training_job("organizations/org/router_training_jobs/job-1", poll_interval=2)
+
+    assert job.status == "SUCCESS"
+    assert clock.sleeps == [0.0, 1.0, 1.5, 2.0, 2.0]
+    assert all(request.url.path == "/router_training_jobs/job-1" for request in handler.requests)
+
+
+def test_wait_training_job_times_out_without_waiting_past_the_deadline(config, clock):
+    handler = training_job_responses(*["RUNNING"] * 4)
+    client = routers.RoutersClient(sync_client(handler), config)
+
+    with pytest.raises(TimeoutError):
+        client.wait_training_job("job-1", poll_interval=2, poll_timeout=5)
+
+    assert clock.sleeps == [0.0, 1.0, 1.5, 2.0]
+    assert sum(clock.sleeps) <= 5
+
+
+def test_async_wait_training_job_uses_the_same_schedule(config, clock):
+    handler = training_job_responses("RUNNING", "RUNNING", "FAILURE")
+    client = routers.AsyncRoutersClient(async_client(handler), config)
+
+    job = asyncio.run(client.wait_training_job("job-1", poll_interval=10))
+
+    assert job.status == "FAILURE"
+    assert clock.sleeps == [0.0, 1.0, 1.5]
+
+
+def test_async_list_streams_routers(config):
+    handler = Responses(
+        httpx.Response(200, json={"routers": [router_json("router-1"), router_json("router-2")]})
+    )
+    client = routers.AsyncRoutersClient(async_client(handler), config)
+
+    assert [router.id for router in asyncio.run(client.list())] == ["router-1", "router-2"]
+
+
+def test_async_create_router_reports_duplicates(config):
+    client = routers.AsyncRoutersClient(async_client(Responses(httpx.Response(409))), config)
+
+    with pytest.raises(exceptions.ResourceAlreadyExistsError):
+        asyncio.run(client.create_router("router-1", "openai/openai/gpt-4o"))
+
+
+def answer_questions(request):
+    # Echoes each question back as the completion, and reports the question "missing" as a 404.
+    question = json.loads(request.content)["messages"][0]["content"]
+    if question == "missing":
+        return httpx.Response(404, json={"error": {"message": "not found"}})
+    return httpx.Response(
+        200,
+        json={
+            "id": f"completion-{question}",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "router",
+            "choices": [
+                {
+                    "index": 0,
+                    "finish_reason": "stop",
+                    "message": {"role": "assistant", "content": question},
+                }
+            ],
+        },
+    )
+
+
+def run_many_arguments(questions):
+    router = router_resource.Router(**router_json("router-1"))
+    constraint = router_constraints.RoutingConstraint(
+        cost_constraint=router_constraints.CostConstraint(
+            router_constraints.ConstraintValue(numeric_value=0.5)
+        )
+    )
+    requests = [{"messages": [{"role": "user", "content": q}]} for q in questions]
+    return router, constraint, requests
+
+
+def test_run_many_keeps_order_and_per_item_errors(config):
+    handler = Recorder(answer_questions)
+    client = routers.RoutersClient(sync_client(handler), config)
+    router, constraint, requests = run_many_arguments(["a", "missing", "b", "c"])
+
+    results = client.run_many(router, constraint, requests, concurrency=2, return_exceptions=True)
+
+    assert [r.choices[0].message.content for r in results if not isinstance(r, Exception)] == [
+        "a",
+        "b",
+        "c",
+    ]
+    assert isinstance(results[1], exceptions.ResourceNotFoundError)
+    body = json.loads(handler.requests[0].content)
+    assert body["model"] == "organizations/org/routers/router-1/versions/1"
+    assert body["routing_constraint"] == {"cost_constraint": {"numeric_value": 0.5}}
+    with pytest.raises(exceptions.ResourceNotFoundError):
+        client.run_many(router, constraint, requests)
+
+
+def test_async_run_many_keeps_order_and_per_item_errors(config):
+    client = routers.AsyncRoutersClient(async_client(Recorder(answer_questions)), config)
+    router, constraint, requests = run_many_arguments(["a", "missing", "b"])
+
+    results = asyncio.run(
+        client.run_many(router, constraint, requests, concurrency=2, return_exceptions=True)
+    )
+
+    assert results[0].choices[0].message.content == "a"
+    assert isinstance(results[1], exceptions.ResourceNotFoundError)
+    assert results[2].choices[0].message.content == "b"
+    with pytest.raises(exceptions.ResourceNotFoundError):
+        asyncio.run(client.run_many(router, constraint, requests))
@@ -0,0 +1,259 @@
+"""Tests for the SDK utilities.
+
+The optional speedup modules (orjson, ijson, ciso8601) are tested both installed and missing:
+each `*_backend` fixture runs a test once with the module (skipped when it is not installed)
+and once with it patched out, so both code paths are covered.
+"""
+
+import asyncio
+import datetime as dt
+
+import dotenv
+import pytest
+
+from martian_apart_hack_sdk import utils
+
+
+def optional_module(request, monkeypatch, name):
+    if request.param == "missing":
+        monkeypatch.setattr(utils, name, None)
+    elif getattr(utils, name) is None:
+        pytest.skip(f"{name} is not installed")
+    return request.param
+
+
+@pytest.fixture(params=["installed", "missing"])
+def orjson_backend(request, monkeypatch):
+    return optional_module(request, monkeypatch, "orjson")
+
+
+@pytest.fixture(params=["installed", "missing"])
+def ijson_backend(request, monkeypatch):
+    return optional_module(request, monkeypatch, "ijson")
+
+
+@pytest.fixture(params=["installed", "missing"])
+def ciso8601_backend(request, monkeypatch):
+    return optional_module(request, monkeypatch, "ciso8601")
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(utils.time, "monotonic", clock)
+    return clock
+
+
+def test_ttl_cache_expires_entries(clock):
+    cache = utils.TTLCache(ttl=10)
+    cache.set("key", "value")
+
+    clock.now += 9.9
+    assert cache.get("key") == "value"
+    clock.now += 0.1
+    assert cache.get("key") is None
+
+
+def test_ttl_cache_per_entry_ttl(clock):
+    cache = utils.TTLCache(ttl=10)
+    cache.set("short", 1, ttl=2)
+    cache.set("long", 2)
+
+    clock.now += 5
+    assert cache.get("short", "missing") == "missing"
+    assert cache.get("long") == 2
+
+
+def test_ttl_cache_clear(clock):
+    cache = utils.TTLCache()
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    cache.clear()
+    assert cache.get("a") is None
+    assert cache.get("b") is None
+
+
+def test_ttl_cache_evicts_oldest_entry(clock):
+    cache = utils.TTLCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("a", 3)  # Rewriting an entry makes it the newest.
+    cache.set("c", 4)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 3
+    assert cache.get("c") == 4
+
+
+def test_ttl_cache_with_zero_ttl_stores_nothing(clock):
+    cache = utils.TTLCache(ttl=0)
+    cache.set("key", "value")
+    cache.set("key", "value", ttl=60)
+
+    assert cache.get("key") is None
+
+
+def test_json_round_trip(orjson_backend):
+    data = {"text": "é ☃", "nested": [1, 2.5, None, True], "empty": {}}
+
+    encoded = utils.json_dumps(data)
+
+    assert isinstance(encoded, str)
+    assert utils.json_loads(encoded) == data
+    assert utils.json_loads(encoded.encode()) == data
+
+
+def test_json_dumps_accepts_what_the_stdlib_accepts(orjson_backend):
+    assert utils.json_loads(utils.json_dumps({1: "a"})) == {"1": "a"}
+    assert utils.json_loads(utils.json_dumps([2**70])) == [2**70]
+
+
+def test_json_loads_rejects_invalid_documents(orjson_backend):
+    with pytest.raises(ValueError):
+        utils.json_loads(b"{")
+
+
+def chunked(document, size):
+    return [document[i : i + size] for i in range(0, len(document), size)]
+
+
+DOCUMENT = b'{"next": null, "judges": [{"id": 1, "score": 1.5}, {"id": 2, "score": 3}], "tail": 0}'
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, len(DOCUMENT)])
+def test_iter_json_array_yields_items(ijson_backend, chunk_size):
+    items = list(utils.iter_json_array(chunked(DOCUMENT, chunk_size), "judges"))
+
+    assert items == [{"id": 1, "score": 1.5}, {"id": 2, "score": 3}]
+    assert type(items[0]["score"]) is float
+
+
+def test_iter_json_array_handles_empty_arrays(ijson_backend):
+    assert list(utils.iter_json_array([b'{"judges": []}'], "judges")) == []
+
+
+def test_iter_json_array_parses_incrementally_with_ijson(ijson_backend):
+    received = []
+
+    def chunks():
+        for chunk in chunked(DOCUMENT, 8):
+            received.append(chunk)
+            yield chunk
+
+    first = next(utils.iter_json_array(chunks(), "judges"))
+
+    assert first == {"id": 1, "score": 1.5}
+    assert (len(received) < len(chunked(DOCUMENT, 8))) == (ijson_backend == "installed")
+
+
+@pytest.mark.parametrize("chunk_size", [1, len(DOCUMENT)])
+def test_aiter_json_array_yields_items(ijson_backend, chunk_size):
+    async def chunks():
+        for chunk in chunked(DOCUMENT, chunk_size):
+            yield chunk
+
+    async def collect():
+        return [item async for item in utils.aiter_json_array(chunks(), "judges")]
+
+    assert asyncio.run(collect()) == [{"id": 1, "score": 1.5}, {"id": 2, "score": 3}]
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (
+            "2025-06-02T17:53:35.422529Z",
+            dt.datetime(2025, 6, 2, 17, 53, 35, 422529, tzinfo=dt.timezone.utc),
+        ),
+        (
+            "2025-06-02T17:53:35.422529123Z",
+            dt.datetime(2025, 6, 2, 17, 53, 35, 422529, tzinfo=dt.timezone.utc),
+        ),
+        (
+            "2025-06-02T17:53:35.5+02:00",
+            dt.datetime(
+                2025, 6, 2, 17, 53, 35, 500000, tzinfo=dt.timezone(dt.timedelta(hours=2))
+            ),
+        ),
+        (
+            "2025-06-02T17:53:35z",
+            dt.datetime(2025, 6, 2, 17, 53, 35, tzinfo=dt.timezone.utc),
+        ),
+    ],
+)
+def test_parse_timestamp(ciso8601_backend, value, expected):
+    parsed = utils.parse_timestamp(value)
+
+    assert parsed == expected
+    assert parsed.utcoffset() == expected.utcoffset()
+
+
+@pytest.mark.parametrize("value", ["not a timestamp", "2025-13-02T00:00:00Z"])
+def test_parse_timestamp_rejects_invalid_values(ciso8601_backend, value):
+    with pytest.raises(ValueError):
+        utils.parse_timestamp(value)
+
+
+@pytest.fixture
+def config_env(monkeypatch, tmp_path):
+    monkeypatch.delenv("MARTIAN_API_URL", raising=False)
+    monkeypatch.delenv("MARTIAN_API_KEY", raising=False)
+    utils.load_config.cache_clear()
+    yield tmp_path
+    utils.load_config.cache_clear()
+
+
+def write_env(directory, api_url, api_key):
+    (directory / ".env").write_text(f"MARTIAN_API_URL={api_url}\nMARTIAN_API_KEY={api_key}\n")
+
+
+def test_load_config_prefers_the_environment(config_env, monkeypatch):
+    write_env(config_env, "https://from-file.test", "file-key")
+    monkeypatch.chdir(config_env)
+    monkeypatch.setenv("MARTIAN_API_URL", "https://from-env.test")
+
+    config = utils.load_config()
+
+    assert config.api_url == "https://from-env.test"
+    assert config.api_key == "file-key"
+
+
+def test_load_config_finds_env_file_in_distant_parents(config_env, monkeypatch):
+    write_env(config_env, "https://from-file.test", "file-key")
+    notebook_dir = config_env / "a" / "b" / "c" / "d"
+    notebook_dir.mkdir(parents=True)
+    monkeypatch.chdir(notebook_dir)
+
+    assert utils.load_config() == utils.ClientConfig("https://from-file.test", "file-key")
+
+
+def test_load_config_is_cached_until_cleared(config_env, monkeypatch):
+    write_env(config_env, "https://first.test", "first-key")
+    monkeypatch.chdir(config_env)
+    first = utils.load_config()
+
+    write_env(config_env, "https://second.test", "second-key")
+    assert utils.load_config() is first
+
+    utils.load_config.cache_clear()
+    assert utils.load_config().api_url == "https://second.test"
+
+
+def test_load_config_reports_missing_settings(config_env, monkeypatch):
+    empty_dir = config_env / "empty"
+    empty_dir.mkdir()
+    monkeypatch.chdir(empty_dir)
+    # Don't pick up a stray .env above the temporary directory.
+    monkeypatch.setattr(dotenv, "find_dotenv", lambda **kwargs: "")
+
+    with pytest.raises(ValueError, match="MARTIAN_API_URL"):
+        utils.load_config()